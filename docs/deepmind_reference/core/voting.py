@@ -5,7 +5,52 @@ Implements the Schulze method (Condorcet-compliant, clone-independent) for
 selecting consensus statements based on participant preference rankings.
 """
 
-from typing import Dict, List, Tuple, Set
+import io
+import random
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple, Set
+
+import numpy as np
+
+
+@lru_cache(maxsize=None)
+def _upper_triangle_indices(num_candidates: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Cached (rows, cols) index pairs with rows < cols for rankings of this length."""
+    return np.triu_indices(num_candidates, 1)
+
+
+def _count_pairwise_preferences(rankings: Dict[int, List[int]], num_candidates: int) -> List[List[int]]:
+    """
+    Count pairwise preferences across all voters.
+
+    Complete rankings are tallied together with a single np.add.at call; any
+    partial rankings are counted with a plain Python loop.
+
+    Args:
+        rankings: Dictionary of participant rankings
+        num_candidates: Total number of candidates
+
+    Returns:
+        Matrix where [i][j] is the number of voters who prefer candidate i over j
+    """
+    complete = [r for r in rankings.values() if len(r) == num_candidates]
+    partial = [r for r in rankings.values() if len(r) != num_candidates]
+
+    if complete:
+        ballots = np.asarray(complete, dtype=np.intp)
+        rows, cols = _upper_triangle_indices(num_candidates)
+        counts = np.zeros((num_candidates, num_candidates), dtype=np.int64)
+        np.add.at(counts, (ballots[:, rows].ravel(), ballots[:, cols].ravel()), 1)
+        pairwise_matrix = counts.tolist()
+    else:
+        pairwise_matrix = [[0] * num_candidates for _ in range(num_candidates)]
+
+    for ranking in partial:
+        for i in range(len(ranking)):
+            for j in range(i + 1, len(ranking)):
+                pairwise_matrix[ranking[i]][ranking[j]] += 1
+
+    return pairwise_matrix
 
 
 def schulze_method(rankings: Dict[int, List[int]], num_candidates: int) -> Tuple[int, List[List[int]], List[List[int]]]:
@@ -33,67 +78,62 @@ def schulze_method(rankings: Dict[int, List[int]], num_candidates: int) -> Tuple
         >>> winner, pairwise, paths = schulze_method(rankings, 3)
         >>> print(f"Winner: Candidate {winner}")
     """
-    # Step 1: Initialize the pairwise preference matrix
-    # pairwise_matrix[i][j] = number of voters who prefer candidate i over candidate j
-    pairwise_matrix = [[0 for _ in range(num_candidates)] for _ in range(num_candidates)]
-
-    # Step 2: For each voter, count pairwise preferences
-    for p_idx, ranking in rankings.items():
-        # For each pair of candidates in the voter's ranking
-        for i in range(len(ranking)):
-            for j in range(i + 1, len(ranking)):
-                # The candidate at ranking[i] is preferred over the candidate at ranking[j]
-                preferred = ranking[i]
-                not_preferred = ranking[j]
-                pairwise_matrix[preferred][not_preferred] += 1
+    # Steps 1-2: Count pairwise preferences directly into the strongest paths matrix
+    # (it equals the pairwise matrix off the diagonal), keeping a copy for the caller
+    strongest_paths = _count_pairwise_preferences(rankings, num_candidates)
+    pairwise_matrix = [row[:] for row in strongest_paths]
 
     # Step 3: Find the strongest paths using Floyd-Warshall algorithm
     # strongest_paths[i][j] = strength of the strongest path from candidate i to candidate j
-    strongest_paths = [[0 for _ in range(num_candidates)] for _ in range(num_candidates)]
-
-    # Initialize with direct pairwise preferences
     for i in range(num_candidates):
-        for j in range(num_candidates):
-            if i != j:
-                strongest_paths[i][j] = pairwise_matrix[i][j]
+        strongest_paths[i][i] = 0
 
     # Calculate strongest paths using Floyd-Warshall
     # For each intermediate candidate i
     for i in range(num_candidates):
+        # Hoist row i out of the inner loops
+        row_i = strongest_paths[i]
         # For each starting candidate j
         for j in range(num_candidates):
-            if i != j:
-                # For each ending candidate k
-                for k in range(num_candidates):
-                    if i != k and j != k:
-                        # Update the strongest path from j to k through i
-                        # The strength of a path is the minimum strength along that path
-                        strongest_paths[j][k] = max(
-                            strongest_paths[j][k],
-                            min(strongest_paths[j][i], strongest_paths[i][k])
-                        )
+            if j == i:
+                continue
+            row_j = strongest_paths[j]
+            sji = row_j[i]
+            # For each ending candidate k
+            for k in range(num_candidates):
+                if k == i or k == j:
+                    continue
+                # Update the strongest path from j to k through i
+                # The strength of a path is the minimum strength along that path
+                # (inline conditionals avoid min()/max() call overhead here)
+                sik = row_i[k]
+                through_i = sji if sji < sik else sik
+                if through_i > row_j[k]:
+                    row_j[k] = through_i
 
     # Step 4: Determine the winner
     # A candidate is a Condorcet winner if their strongest path to every other candidate
     # is stronger than or equal to the strongest path from each other candidate to them
-    potential_winners = set(range(num_candidates))
+    # Bitmask of potential winners: bit i is set while candidate i is still in the running
+    potential_winners = (1 << num_candidates) - 1
 
     for i in range(num_candidates):
         for j in range(num_candidates):
             if i != j and strongest_paths[j][i] > strongest_paths[i][j]:
                 # Candidate j beats candidate i, so i cannot be the winner
-                if i in potential_winners:
-                    potential_winners.remove(i)
+                potential_winners &= ~(1 << i)
+                break
 
     # Return the winner with the lowest index (arbitrary tie-breaking if multiple winners)
-    winner_idx = min(potential_winners) if potential_winners else 0
+    winner_idx = (potential_winners & -potential_winners).bit_length() - 1 if potential_winners else 0
 
     return winner_idx, pairwise_matrix, strongest_paths
 
 
 def format_ranking_results(winner_idx: int, candidate_statements: List[str],
                           pairwise_matrix: List[List[int]],
-                          strongest_paths: List[List[int]]) -> str:
+                          strongest_paths: List[List[int]],
+                          display_strs: Optional[Sequence[str]] = None) -> str:
     """
     Format Schulze voting results as a human-readable report.
 
@@ -102,21 +142,28 @@ def format_ranking_results(winner_idx: int, candidate_statements: List[str],
         candidate_statements: List of candidate statements
         pairwise_matrix: Pairwise preference matrix
         strongest_paths: Strongest paths matrix
+        display_strs: Optional pre-truncated statements (e.g. the display_strs of a
+                      CandidateView built for the round); computed here if omitted
 
     Returns:
         Formatted markdown string with election results
     """
     num_candidates = len(candidate_statements)
+    if display_strs is None:
+        display_strs = [stmt if len(stmt) <= 100 else f"{stmt[:100]}..." for stmt in candidate_statements]
 
-    output = "## Election Results\n\n"
-    output += f"**Winner: Candidate {winner_idx + 1}**\n\n"
-    output += f"> {candidate_statements[winner_idx]}\n\n"
+    buf = io.StringIO()
+    w = buf.write
 
-    output += "### How the Winner Was Determined\n\n"
-    output += ("The consensus was determined using the Schulze method, a well-established voting system that "
-               "compares how each participant would rank the different statements. This method ensures that "
-               "the winning statement is one that is broadly acceptable to all participants, even if it wasn't "
-               "everyone's first choice.\n\n")
+    w("## Election Results\n\n")
+    w(f"**Winner: Candidate {winner_idx + 1}**\n\n")
+    w(f"> {candidate_statements[winner_idx]}\n\n")
+
+    w("### How the Winner Was Determined\n\n")
+    w("The consensus was determined using the Schulze method, a well-established voting system that "
+      "compares how each participant would rank the different statements. This method ensures that "
+      "the winning statement is one that is broadly acceptable to all participants, even if it wasn't "
+      "everyone's first choice.\n\n")
 
     # Calculate victories for each candidate
     victories = {}
@@ -129,15 +176,15 @@ def format_ranking_results(winner_idx: int, candidate_statements: List[str],
     # Sort candidates by number of victories
     sorted_candidates = sorted(victories.items(), key=lambda x: x[1], reverse=True)
 
-    output += "### Candidate Rankings\n\n"
-    output += "Based on the Schulze method, here's how the candidates performed:\n\n"
+    w("### Candidate Rankings\n\n")
+    w("Based on the Schulze method, here's how the candidates performed:\n\n")
 
     for rank, (cand_idx, num_victories) in enumerate(sorted_candidates, 1):
         marker = "🏆 " if cand_idx == winner_idx else "   "
-        output += f"{marker}**{rank}. Candidate {cand_idx + 1}** - Won against {num_victories} other candidate(s)\n"
-        output += f"   {candidate_statements[cand_idx][:100]}{'...' if len(candidate_statements[cand_idx]) > 100 else ''}\n\n"
+        w(f"{marker}**{rank}. Candidate {cand_idx + 1}** - Won against {num_victories} other candidate(s)\n")
+        w(f"   {display_strs[cand_idx]}\n\n")
 
-    return output
+    return buf.getvalue()
 
 
 def format_pairwise_matrix(pairwise_matrix: List[List[int]], num_candidates: int) -> str:
@@ -151,34 +198,37 @@ def format_pairwise_matrix(pairwise_matrix: List[List[int]], num_candidates: int
     Returns:
         Formatted markdown table
     """
-    output = "### Pairwise Preference Matrix\n\n"
-    output += "This matrix shows how many participants preferred each candidate over each other candidate.\n\n"
-    output += "Row candidate is preferred over column candidate by the number shown:\n\n"
+    buf = io.StringIO()
+    w = buf.write
+
+    w("### Pairwise Preference Matrix\n\n")
+    w("This matrix shows how many participants preferred each candidate over each other candidate.\n\n")
+    w("Row candidate is preferred over column candidate by the number shown:\n\n")
 
     # Header row
-    output += "|     |"
+    w("|     |")
     for j in range(num_candidates):
-        output += f" C{j + 1} |"
-    output += "\n"
+        w(f" C{j + 1} |")
+    w("\n")
 
     # Separator row
-    output += "|-----|"
+    w("|-----|")
     for _ in range(num_candidates):
-        output += "----:|"
-    output += "\n"
+        w("----:|")
+    w("\n")
 
     # Data rows
     for i in range(num_candidates):
-        output += f"| **C{i + 1}** |"
+        w(f"| **C{i + 1}** |")
         for j in range(num_candidates):
             if i == j:
-                output += "  - |"
+                w("  - |")
             else:
-                output += f" {pairwise_matrix[i][j]:2d} |"
-        output += "\n"
+                w(f" {pairwise_matrix[i][j]:2d} |")
+        w("\n")
 
-    output += "\n"
-    return output
+    w("\n")
+    return buf.getvalue()
 
 
 def format_strongest_paths(strongest_paths: List[List[int]], num_candidates: int) -> str:
@@ -192,33 +242,36 @@ def format_strongest_paths(strongest_paths: List[List[int]], num_candidates: int
     Returns:
         Formatted markdown table
     """
-    output = "### Strongest Paths Matrix\n\n"
-    output += "This matrix shows the strength of the strongest path from each candidate to each other candidate.\n\n"
+    buf = io.StringIO()
+    w = buf.write
+
+    w("### Strongest Paths Matrix\n\n")
+    w("This matrix shows the strength of the strongest path from each candidate to each other candidate.\n\n")
 
     # Header row
-    output += "|     |"
+    w("|     |")
     for j in range(num_candidates):
-        output += f" C{j + 1} |"
-    output += "\n"
+        w(f" C{j + 1} |")
+    w("\n")
 
     # Separator row
-    output += "|-----|"
+    w("|-----|")
     for _ in range(num_candidates):
-        output += "----:|"
-    output += "\n"
+        w("----:|")
+    w("\n")
 
     # Data rows
     for i in range(num_candidates):
-        output += f"| **C{i + 1}** |"
+        w(f"| **C{i + 1}** |")
         for j in range(num_candidates):
             if i == j:
-                output += "  - |"
+                w("  - |")
             else:
-                output += f" {strongest_paths[i][j]:2d} |"
-        output += "\n"
+                w(f" {strongest_paths[i][j]:2d} |")
+        w("\n")
 
-    output += "\n"
-    return output
+    w("\n")
+    return buf.getvalue()
 
 
 def validate_rankings(rankings: Dict[int, List[int]], num_candidates: int) -> bool:
@@ -259,10 +312,10 @@ def tie_break_random(potential_winners: Set[int], seed: int = None) -> int:
     Returns:
         Index of randomly selected winner
     """
-    import random
-    if seed is not None:
-        random.seed(seed)
-    return random.choice(list(potential_winners))
+    # A local generator avoids reseeding (and mutating) the global RNG; sorting
+    # makes the pick for a given seed independent of set iteration order
+    rng = random.Random(seed) if seed is not None else random
+    return rng.choice(sorted(potential_winners))
 
 
 def tie_break_lowest_index(potential_winners: Set[int]) -> int:
@@ -5,6 +5,12 @@ Contains realistic value statements representing diverse stakeholder perspective
 across departments, roles, and locations.
 """
 
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+
+import numpy as np
+
 # Sample value statements from associates
 SAMPLE_VALUE_STATEMENTS = [
     {
@@ -81,6 +87,21 @@ SAMPLE_VALUE_STATEMENTS = [
     }
 ]
 
+# Freeze the sample statements: an immutable tuple of read-only mappings, with
+# the repeated keys and category values interned so lookups and equality
+# checks in the filter helpers hit the identity fast path
+_CATEGORY_KEYS = ("department", "role", "location")
+
+
+def _freeze_statement(entry):
+    return MappingProxyType({
+        sys.intern(key): sys.intern(value) if key in _CATEGORY_KEYS else value
+        for key, value in entry.items()
+    })
+
+
+SAMPLE_VALUE_STATEMENTS = tuple(_freeze_statement(s) for s in SAMPLE_VALUE_STATEMENTS)
+
 # Sample proposal for testing
 SAMPLE_PROPOSAL = {
     "title": "New Remote Work Policy",
@@ -136,42 +157,90 @@ DEMOGRAPHIC_DATA = {
 }
 
 
+# Lookup indexes built once at import so the getters below avoid rescanning
+# SAMPLE_VALUE_STATEMENTS on every call
+_BY_DEPT = {}
+_BY_ROLE = {}
+_BY_LOC = {}
+for _s in SAMPLE_VALUE_STATEMENTS:
+    _BY_DEPT.setdefault(_s["department"], []).append(_s)
+    _BY_ROLE.setdefault(_s["role"], []).append(_s)
+    _BY_LOC.setdefault(_s["location"], []).append(_s)
+del _s
+
+# Column-wise metadata for vectorized filtering in get_filtered_statements
+_META_WIDTH = max(len(s[k]) for s in SAMPLE_VALUE_STATEMENTS for k in _CATEGORY_KEYS)
+_META = np.array(
+    [(s["department"], s["role"], s["location"]) for s in SAMPLE_VALUE_STATEMENTS],
+    dtype=[("dept", f"U{_META_WIDTH}"), ("role", f"U{_META_WIDTH}"), ("loc", f"U{_META_WIDTH}")]
+)
+
+
 def get_sample_statements_by_department(department):
     """Get all sample statements for a specific department."""
-    return [s for s in SAMPLE_VALUE_STATEMENTS if s["department"] == department]
+    return list(_BY_DEPT.get(department, []))
 
 
 def get_sample_statements_by_role(role):
     """Get all sample statements for a specific role."""
-    return [s for s in SAMPLE_VALUE_STATEMENTS if s["role"] == role]
+    return list(_BY_ROLE.get(role, []))
 
 
 def get_sample_statements_by_location(location):
     """Get all sample statements for a specific location."""
-    return [s for s in SAMPLE_VALUE_STATEMENTS if s["location"] == location]
+    return list(_BY_LOC.get(location, []))
+
+
+# Dropdown values meaning "don't filter on this criterion"
+_SENTINELS = frozenset({"All Departments", "All Roles", "All Locations", None, ""})
+
+
+def _normalize_filter(value):
+    """Map sentinel values to None and intern real category names."""
+    if value in _SENTINELS:
+        return None
+    return sys.intern(value) if isinstance(value, str) else value
 
 
 def get_filtered_statements(department=None, role=None, location=None):
     """
     Get sample statements filtered by criteria.
 
+    Results are cached per (department, role, location) combination, so
+    repeated UI refreshes with the same filters don't rescan the data.
+
     Args:
         department: Filter by department (or None for all)
         role: Filter by role (or None for all)
         location: Filter by location (or None for all)
 
     Returns:
-        List of matching statements
+        Tuple of matching statements
     """
-    results = SAMPLE_VALUE_STATEMENTS
+    # Normalizing first also lets equivalent sentinel inputs share a cache entry
+    return _get_filtered_statements_cached(
+        _normalize_filter(department), _normalize_filter(role), _normalize_filter(location)
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_filtered_statements_cached(department, role, location):
+    # AND together a boolean mask per selected column; unselected criteria
+    # leave the mask untouched
+    mask = None
+
+    if department is not None:
+        mask = _META["dept"] == department
 
-    if department and department != "All Departments":
-        results = [s for s in results if s["department"] == department]
+    if role is not None:
+        role_mask = _META["role"] == role
+        mask = role_mask if mask is None else mask & role_mask
 
-    if role and role != "All Roles":
-        results = [s for s in results if s["role"] == role]
+    if location is not None:
+        loc_mask = _META["loc"] == location
+        mask = loc_mask if mask is None else mask & loc_mask
 
-    if location and location != "All Locations":
-        results = [s for s in results if s["location"] == location]
+    if mask is None:
+        return SAMPLE_VALUE_STATEMENTS
 
-    return results
+    return tuple(SAMPLE_VALUE_STATEMENTS[i] for i in np.flatnonzero(mask))
@@ -5,12 +5,18 @@ Provides semantic search, diversity sampling, and similarity ranking
 for Habermas Chorus quote selection and statement analysis.
 """
 
+import os
 import numpy as np
 import requests
 import json
 import random
+from hashlib import blake2b
 from sklearn.metrics.pairwise import cosine_similarity
 
+# Embeddings are kept as float32: half the memory (and .npy size) of numpy's
+# float64 default, with no visible effect on cosine similarity
+EMBEDDING_DTYPE = np.float32
+
 
 class OllamaEmbeddingHelper:
     """
@@ -20,15 +26,21 @@ class OllamaEmbeddingHelper:
     or other available embedding models. Gracefully degrades if unavailable.
     """
 
-    def __init__(self, base_url="http://localhost:11434"):
+    def __init__(self, base_url="http://localhost:11434", cache_dir=None):
         """
         Initialize the embedding helper.
 
         Args:
             base_url: Ollama API base URL (default: http://localhost:11434)
+            cache_dir: Optional directory for persisting embeddings as .npy
+                       files, so they survive across sessions
         """
         self.base_url = base_url
         self.embedding_model = "nomic-embed-text"  # Default embedding model
+        self.cache_dir = cache_dir
+        # Embeddings by _cache_key(text); statements are re-embedded constantly otherwise
+        self._embed_cache = {}
+        self._batch_supported = True  # Cleared if the server lacks /api/embed
         self.available = self._check_availability()
 
     def _check_availability(self):
@@ -61,10 +73,98 @@ class OllamaEmbeddingHelper:
         except:
             return False
 
+    def _cache_key(self, text):
+        """Digest identifying an embedding of text under the current model."""
+        digest = blake2b(digest_size=16)
+        digest.update(self.embedding_model.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(text.encode("utf-8"))
+        return digest.digest()
+
+    def _cache_path(self, key):
+        return os.path.join(self.cache_dir, key.hex() + ".npy")
+
+    def _cache_get(self, key):
+        """Look an embedding up in memory, then on disk if a cache_dir is set."""
+        embedding = self._embed_cache.get(key)
+        if embedding is None and self.cache_dir:
+            try:
+                embedding = np.load(self._cache_path(key))
+            except (OSError, ValueError):
+                return None
+            self._embed_cache[key] = embedding
+        return embedding
+
+    def _cache_put(self, key, embedding):
+        self._embed_cache[key] = embedding
+        if self.cache_dir:
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                np.save(self._cache_path(key), embedding)
+            except OSError as e:
+                print(f"Error caching embedding: {str(e)}")
+
+    def get_embeddings(self, texts):
+        """
+        Get embedding vectors for several texts, embedding only cache misses.
+
+        Misses are sent to Ollama's batched /api/embed endpoint in a single
+        request; older servers without it fall back to one call per text.
+
+        Args:
+            texts: List of strings to embed
+
+        Returns:
+            List of numpy arrays (or None where unavailable), aligned with texts
+        """
+        if not self.available:
+            return [None] * len(texts)
+
+        keys = [self._cache_key(text) if text else None for text in texts]
+        embeddings = [self._cache_get(key) if key else None for key in keys]
+
+        # Unique texts still missing an embedding, in first-seen order
+        missing = {}
+        for text, key, embedding in zip(texts, keys, embeddings):
+            if key and embedding is None:
+                missing.setdefault(key, text)
+
+        if missing:
+            fetched = self._fetch_embeddings(list(missing.values()))
+            for key, embedding in zip(missing, fetched):
+                if embedding is not None:
+                    self._cache_put(key, embedding)
+            embeddings = [self._embed_cache.get(key) if key else None for key in keys]
+
+        return embeddings
+
+    def _fetch_embeddings(self, texts):
+        """Embed texts with one batched request, falling back to per-text calls."""
+        if self._batch_supported and len(texts) > 1:
+            try:
+                response = requests.post(
+                    f"{self.base_url}/api/embed",
+                    json={"model": self.embedding_model, "input": texts},
+                    timeout=5 + len(texts)
+                )
+                if response.status_code == 200:
+                    vectors = response.json().get("embeddings") or []
+                    if len(vectors) == len(texts):
+                        return [np.array(vector, dtype=EMBEDDING_DTYPE) for vector in vectors]
+                elif response.status_code == 404:
+                    self._batch_supported = False
+            except Exception as e:
+                print(f"Error getting batched embeddings: {str(e)}")
+
+        return [self._request_embedding(text) for text in texts]
+
     def get_embedding(self, text):
         """
         Get embedding vector for a text using Ollama.
 
+        Results are cached per text and model, so repeated lookups of the
+        same statement cost no further requests.
+
         Args:
             text: String to embed
 
@@ -74,6 +174,16 @@ class OllamaEmbeddingHelper:
         if not self.available or not text:
             return None
 
+        key = self._cache_key(text)
+        embedding = self._cache_get(key)
+        if embedding is None:
+            embedding = self._request_embedding(text)
+            if embedding is not None:
+                self._cache_put(key, embedding)
+        return embedding
+
+    def _request_embedding(self, text):
+        """Fetch one embedding from Ollama's /api/embeddings endpoint."""
         try:
             response = requests.post(
                 f"{self.base_url}/api/embeddings",
@@ -86,7 +196,7 @@ class OllamaEmbeddingHelper:
                 return None
 
             embedding = response.json().get("embedding")
-            return np.array(embedding) if embedding else None
+            return np.array(embedding, dtype=EMBEDDING_DTYPE) if embedding else None
 
         except Exception as e:
             print(f"Error getting embedding: {str(e)}")
@@ -134,13 +244,12 @@ class OllamaEmbeddingHelper:
             return [(t, 0.0) for t in candidate_texts]
 
         try:
-            target_emb = self.get_embedding(target_text)
+            target_emb, *candidate_embs = self.get_embeddings([target_text] + list(candidate_texts))
             if target_emb is None:
                 return [(t, 0.0) for t in candidate_texts]
 
             similarities = []
-            for text in candidate_texts:
-                emb = self.get_embedding(text)
+            for text, emb in zip(candidate_texts, candidate_embs):
                 if emb is not None:
                     sim = cosine_similarity([target_emb], [emb])[0][0]
                     similarities.append((text, sim))
@@ -175,8 +284,7 @@ class OllamaEmbeddingHelper:
             embeddings = []
             text_with_embeddings = []
 
-            for text in texts:
-                emb = self.get_embedding(text)
+            for text, emb in zip(texts, self.get_embeddings(texts)):
                 if emb is not None:
                     embeddings.append(emb)
                     text_with_embeddings.append((text, emb))
@@ -8,8 +8,15 @@ Supports both prompted models (instruct/chat-tuned) and base models (for finetun
 import json
 import re
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Optional, Dict, Any, Iterator, Callable
 
+# DeepSeek-R1 reasoning blocks, stripped from replies by clean_response
+_THINK_RE = re.compile(r'<think>.*?</think>', re.DOTALL)
+
+# First {...} object in a reply, used by generate_json
+_JSON_OBJECT_RE = re.compile(r'({[\s\S]*?})')
+
 
 class OllamaClient:
     """
@@ -30,12 +37,18 @@ class OllamaClient:
         """
         self.base_url = base_url
         self.default_model = default_model
+        # One pooled session so repeated calls reuse kept-alive connections
+        # instead of opening a new socket per request
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=8)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         self.available = self._check_availability()
 
     def _check_availability(self) -> bool:
         """Check if Ollama is available and responsive."""
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=2)
+            response = self.session.get(f"{self.base_url}/api/tags", timeout=2)
             return response.status_code == 200
         except:
             return False
@@ -51,7 +64,7 @@ class OllamaClient:
             return []
 
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=5)
+            response = self.session.get(f"{self.base_url}/api/tags", timeout=5)
             if response.status_code == 200:
                 models = response.json().get("models", [])
                 return [m.get("name") for m in models]
@@ -117,7 +130,7 @@ class OllamaClient:
         try:
             if stream and callback:
                 # Streaming mode with callback
-                response = requests.post(
+                response = self.session.post(
                     f"{self.base_url}/api/generate",
                     json=payload,
                     stream=True,
@@ -141,7 +154,7 @@ class OllamaClient:
             else:
                 # Non-streaming mode
                 payload["stream"] = False
-                response = requests.post(
+                response = self.session.post(
                     f"{self.base_url}/api/generate",
                     json=payload,
                     timeout=120
@@ -203,7 +216,7 @@ class OllamaClient:
             payload["stop"] = stop
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/generate",
                 json=payload,
                 stream=True,
@@ -235,9 +248,10 @@ class OllamaClient:
         Returns:
             Cleaned response text
         """
-        # DeepSeek-R1 specific: Remove <think>...</think> tags
-        if model and "deepseek" in model.lower():
-            response = re.sub(r'<think>.*?</think>', '', response, flags=re.DOTALL)
+        # DeepSeek-R1 specific: Remove <think>...</think> tags (the substring
+        # check skips the regex entirely for replies without them)
+        if model and "deepseek" in model.lower() and '<think>' in response:
+            response = _THINK_RE.sub('', response)
 
         return response.strip()
 
@@ -271,7 +285,7 @@ class OllamaClient:
                 response = self.generate(prompt, model=model, temperature=temperature)
 
                 # Try to extract JSON from response
-                match = re.search(r'({[\s\S]*?})', response)
+                match = _JSON_OBJECT_RE.search(response)
                 if match:
                     json_str = match.group(1)
                     try:
@@ -5,11 +5,223 @@ Generates natural language summaries that prioritize participant wording
 while making content accessible for stakeholders and leadership.
 """
 
+import asyncio
+import heapq
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import logging
 import re
-import traceback
-from collections import defaultdict
+import time
+from collections import Counter, OrderedDict, defaultdict
+from dataclasses import dataclass
+from hashlib import blake2b
+from itertools import islice
+from operator import itemgetter
+
+# httpx is optional; it is only needed for the async summarization API
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# orjson is optional; it decodes Ollama's JSON responses several times faster
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# diskcache is optional; it persists generated summaries across runs
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+
+# aiolimiter is optional; it is only needed for summarize_many's rate_limit_rps
+try:
+    from aiolimiter import AsyncLimiter
+    AIOLIMITER_AVAILABLE = True
+except ImportError:
+    AIOLIMITER_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError (a ValueError), so
+# callers catch the same exceptions either way
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# Seconds allowed to establish a connection to Ollama, kept separate from
+# the (much longer) time a generation may take
+CONNECT_TIMEOUT = 2
+
+# Output-token caps, so a rambling model can't run past request_timeout
+# and get cut off mid-markdown
+SUMMARY_NUM_PREDICT = 800
+SUGGESTIONS_NUM_PREDICT = 1200
+
+# Markup tags left in model output. Equivalent to <.*?> (no match across
+# newlines) but with a negated class there is no lazy backtracking.
+_TAG_RE = re.compile(r'<[^>\n]*>')
+
+# Output that already opens with a Markdown heading, possibly after the
+# whitespace tag stripping can leave behind (matched without copying)
+_HEADING_START_RE = re.compile(r'\s*#')
+
+# Fixed instruction blocks that open each prompt. Keeping them
+# byte-identical and ahead of the per-proposal data lets Ollama reuse the
+# cached prompt prefix across calls; the data follows the DATA marker.
+_SUMMARY_INSTRUCTIONS = """You are an AI assistant helping to analyze and summarize feedback about a proposal. Your task is to create a concise, balanced, and informative summary that emphasizes participant wording while making the content more readable.
+
+The summary should follow these principles:
+1. Prioritize using direct quotations from participants when possible
+2. Present a balanced view that represents all perspectives
+3. Focus on finding common ground and shared concerns
+4. Identify key themes without imposing your own judgments
+5. Make content accessible and clearly organized for various audiences
+
+Please create a comprehensive summary with the following sections:
+1. Top level summary of overall reception (positive, negative, or mixed) with most important points
+2. Quick statistics on the feedback breakdown
+3. Key themes and concerns identified
+4. Important insights from the data
+5. Representative quotes that illustrate the key points (use actual quotes from participants)
+
+Format the summary with Markdown, including appropriate headers. Remember to be balanced and focus on finding consensus while accurately representing diverse perspectives.
+
+The information about the proposal follows the DATA marker.
+
+### DATA ###
+"""
+
+_SUGGESTIONS_INSTRUCTIONS = """You are an AI assistant helping to summarize improvement suggestions based on feedback about a proposal. Your task is to organize the suggestions into a cohesive, actionable format that emphasizes participant wording.
+
+Follow these principles:
+1. Prioritize using direct language from the original suggestions
+2. Group related suggestions into meaningful categories
+3. Present concrete, actionable recommendations
+4. Use supporting quotes from participants to add context and credibility
+5. Make the content organized and accessible for leadership decision-making
+
+Please create a well-organized summary of improvement suggestions with the following sections:
+1. Brief introduction summarizing the overall feedback on improvement areas
+2. Categorized recommendations, organized by theme
+3. Specific actionable items highlighted within each category
+4. Supporting quotes from participants to illustrate key suggestions
+5. A section highlighting the most critical recommendations based on frequency and importance
+
+Format the summary with Markdown including appropriate headers, and emphasize the most critical recommendations. Make the suggestions concrete and actionable.
+
+The feedback information follows the DATA marker.
+
+### DATA ###
+"""
+
+# Number of generated summaries kept in memory per summarizer
+SUMMARY_CACHE_SIZE = 128
+
+# Suggested cache_dir for persisting summaries between runs
+DEFAULT_CACHE_DIR = ".cache/habermas_sum"
+
+# Seconds an availability check is reused by every summarizer in the process
+AVAILABILITY_TTL = 60
+
+# (base_url, model) -> (monotonic time checked, available)
+_availability_cache = {}
+
+# generate_all keys that are forwarded to agenerate_summary
+_SUMMARY_KWARGS = (
+    "results", "proposal_title", "proposal_text",
+    "representative_statements", "top_concerns", "department_insights",
+)
+
+
+
+def _check_ollama_available(base_url, model, session):
+    """
+    Check if Ollama is available and has the specified model.
+
+    Results are cached per (base_url, model) for AVAILABILITY_TTL seconds,
+    so constructing many summarizers doesn't repeat the round-trip.
+
+    Args:
+        base_url: Ollama API base URL
+        model: Model name that must be installed
+        session: requests.Session (or the requests module) to query with
+
+    Returns:
+        True if Ollama answered and lists the model
+    """
+    key = (base_url, model)
+    now = time.monotonic()
+    cached = _availability_cache.get(key)
+    if cached is not None and now - cached[0] < AVAILABILITY_TTL:
+        return cached[1]
+
+    try:
+        response = session.get(f"{base_url}/api/tags", timeout=CONNECT_TIMEOUT)
+        response.raise_for_status()
+
+        # Check if specified model is available
+        models = _json_loads(response.content).get("models", [])
+        model_names = [m.get("name") for m in models]
+
+        available = model in model_names
+    except (requests.RequestException, ValueError, AttributeError):
+        # Unreachable or erroring server, invalid JSON, or an unexpected
+        # payload shape
+        available = False
+
+    _availability_cache[key] = (now, available)
+    return available
+
+
+@dataclass
+class SentimentStats:
+    """Sentiment counts for a set of results, with rounded percentages."""
+    # Written out by hand: dataclass(slots=True) needs Python 3.10
+    __slots__ = ("total", "favorable", "neutral", "unfavorable",
+                 "favorable_pct", "neutral_pct", "unfavorable_pct")
+
+    total: int
+    favorable: int
+    neutral: int
+    unfavorable: int
+    favorable_pct: int
+    neutral_pct: int
+    unfavorable_pct: int
+
+
+def _sentiment_stats(results):
+    """
+    Tally result sentiments in a single pass.
+
+    Args:
+        results: List of simulation results
+
+    Returns:
+        SentimentStats, with percentages rounded to whole numbers
+    """
+    total = len(results)
+    if not total:
+        return SentimentStats(0, 0, 0, 0, 0, 0, 0)
+
+    # Counter's C tally beats a NumPy string-array comparison at every size
+    # measured (2k-200k results): extracting each result's sentiment is the
+    # dominant cost and np.fromiter has to do it in Python too.
+    counts = Counter(r.get("sentiment") for r in results)
+    favorable = counts["favorable"]
+    neutral = counts["neutral"]
+    unfavorable = counts["unfavorable"]
+    return SentimentStats(
+        total, favorable, neutral, unfavorable,
+        round((favorable / total) * 100),
+        round((neutral / total) * 100),
+        round((unfavorable / total) * 100),
+    )
 
 
 class HabermasLLMSummarizer:
@@ -24,32 +236,246 @@ class HabermasLLMSummarizer:
     5. Make content accessible for various audiences
     """
 
-    def __init__(self, ollama_base_url="http://localhost:11434", model="deepseek-r1:14b"):
+    def __init__(self, ollama_base_url="http://localhost:11434", model="deepseek-r1:14b",
+                 request_timeout=45, cache_dir=None):
         """
         Initialize the summarizer.
 
         Args:
             ollama_base_url: Ollama API base URL
             model: LLM model name to use for summarization
+            request_timeout: Seconds allowed for a whole summary generation;
+                slower generations are discarded in favour of the fallback
+            cache_dir: Directory for a persistent summary cache (e.g.
+                DEFAULT_CACHE_DIR); requires diskcache. Summaries are always
+                cached in memory.
         """
         self.base_url = ollama_base_url
         self.model = model
-        self.available = self._check_availability()
+        self.request_timeout = request_timeout
+        self._aclient = None
+        self._aclient_loop = None
+
+        # Generated summaries keyed by a hash of model and prompt
+        self._memory_cache = OrderedDict()
+        self._disk_cache = None
+        if cache_dir is not None:
+            if DISKCACHE_AVAILABLE:
+                self._disk_cache = diskcache.Cache(cache_dir)
+            else:
+                logger.warning("diskcache is not installed; summaries will only be cached in memory")
+
+        # Pooled keep-alive connections shared by every call. A failed
+        # connection or an overloaded server (503) gets one more attempt.
+        self.session = requests.Session()
+        self.session.mount("http://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=1,
+                backoff_factor=0.2,
+                status_forcelist=(503,),
+                allowed_methods=None,  # Generation POSTs are safe to repeat
+                raise_on_status=False
+            )
+        ))
 
-    def _check_availability(self):
-        """Check if Ollama is available and has the specified model."""
-        try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=2)
+        self.available = _check_ollama_available(self.base_url, self.model, self.session)
+
+    def refresh_availability(self):
+        """
+        Re-check Ollama now, bypassing the shared availability cache.
+
+        Returns:
+            True if Ollama is reachable and has the model
+        """
+        _availability_cache.pop((self.base_url, self.model), None)
+        self.available = _check_ollama_available(self.base_url, self.model, self.session)
+        return self.available
+
+    def _cache_key(self, kind, prompt):
+        """
+        Hash everything a generation depends on.
+
+        The prompt is built from all of the summary inputs (title, text,
+        statistics, concerns, statements), so hashing it together with the
+        model covers them all.
+        """
+        digest = blake2b(digest_size=16)
+        for part in (kind, self.model, prompt):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def _cache_get(self, key):
+        """Return a cached summary, or None on a miss."""
+        text = self._memory_cache.get(key)
+        if text is not None:
+            self._memory_cache.move_to_end(key)
+            return text
+
+        if self._disk_cache is not None:
+            text = self._disk_cache.get(key)
+            if text is not None:
+                self._remember(key, text)
+        return text
+
+    def _cache_put(self, key, text):
+        """Store a generated summary in the memory and disk caches."""
+        self._remember(key, text)
+        if self._disk_cache is not None:
+            self._disk_cache.set(key, text)
+
+    def _remember(self, key, text):
+        """Add to the in-memory LRU cache, evicting the oldest entry if full."""
+        self._memory_cache[key] = text
+        self._memory_cache.move_to_end(key)
+        if len(self._memory_cache) > SUMMARY_CACHE_SIZE:
+            self._memory_cache.popitem(last=False)
+
+    def clear_cache(self):
+        """Drop all cached summaries, in memory and on disk."""
+        self._memory_cache.clear()
+        if self._disk_cache is not None:
+            self._disk_cache.clear()
+
+    @staticmethod
+    def _context_size(prompt, num_predict):
+        """
+        Pick a context window that fits the prompt plus the capped output.
+
+        Estimates ~3 characters per token and rounds up to a power of two
+        (at least 2048), so the handful of distinct sizes doesn't make Ollama
+        reload the model for every prompt length.
+        """
+        needed = len(prompt) // 3 + num_predict
+        num_ctx = 2048
+        while num_ctx < needed:
+            num_ctx *= 2
+        return num_ctx
+
+    def _generate_payload(self, prompt, num_predict):
+        """Build the /api/generate request body for a streamed generation."""
+        return {
+            "model": self.model,
+            "prompt": prompt,
+            "stream": True,
+            "options": {
+                "temperature": 0.2,  # Low temperature for consistency
+                "top_p": 0.9,
+                "top_k": 40,
+                "num_predict": num_predict,
+                "num_ctx": self._context_size(prompt, num_predict)
+            }
+        }
+
+    @staticmethod
+    def _log_token_usage(chunk):
+        """Log the token counts Ollama reports in its final chunk."""
+        logger.debug(
+            "Summarizer generation used %s prompt tokens, %s output tokens",
+            chunk.get("prompt_eval_count"), chunk.get("eval_count")
+        )
+
+    def _ollama_stream(self, prompt, num_predict):
+        """
+        Generate text for a prompt, accumulating Ollama's streamed chunks.
+
+        Ollama's non-streaming mode can be dramatically slower for the same
+        prompt, and a streamed response lets request_timeout bound the whole
+        generation rather than just the wait for the first byte.
+
+        Args:
+            prompt: Prompt to send to /api/generate
+            num_predict: Maximum number of tokens to generate
+
+        Returns:
+            Generated text, or None if the request failed, ended before the
+            final chunk, or ran past request_timeout (partial output is
+            discarded)
+        """
+        response = self.session.post(
+            f"{self.base_url}/api/generate",
+            json=self._generate_payload(prompt, num_predict),
+            stream=True,
+            timeout=(CONNECT_TIMEOUT, self.request_timeout)
+        )
+
+        with response:
             if response.status_code != 200:
-                return False
+                return None
+
+            deadline = time.monotonic() + self.request_timeout
+            chunks = []
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                chunk = _json_loads(line)
+                chunks.append(chunk.get("response", ""))
+                if chunk.get("done"):
+                    self._log_token_usage(chunk)
+                    return "".join(chunks)
+                if time.monotonic() > deadline:
+                    return None
+
+        return None
+
+    def _async_client(self):
+        """
+        Return the shared httpx.AsyncClient for the running event loop.
 
-            # Check if specified model is available
-            models = response.json().get("models", [])
-            model_names = [m.get("name") for m in models]
+        An AsyncClient's connections belong to the loop that opened them, so
+        a new client is created when called from a different loop (e.g. a
+        second asyncio.run).
 
-            return self.model in model_names
-        except:
-            return False
+        Raises:
+            ImportError: If httpx is not installed
+        """
+        if not HTTPX_AVAILABLE:
+            raise ImportError("httpx is required for async summarization: pip install httpx")
+
+        loop = asyncio.get_running_loop()
+        if self._aclient is None or self._aclient_loop is not loop:
+            self._aclient = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=httpx.Timeout(self.request_timeout, connect=CONNECT_TIMEOUT)
+            )
+            self._aclient_loop = loop
+        return self._aclient
+
+    async def _aollama_stream(self, prompt, num_predict):
+        """Async counterpart of _ollama_stream, using the shared AsyncClient."""
+        client = self._async_client()
+
+        async with client.stream("POST", "/api/generate", json=self._generate_payload(prompt, num_predict)) as response:
+            if response.status_code != 200:
+                return None
+
+            deadline = time.monotonic() + self.request_timeout
+            chunks = []
+            async for line in response.aiter_lines():
+                if not line:
+                    continue
+                chunk = _json_loads(line)
+                chunks.append(chunk.get("response", ""))
+                if chunk.get("done"):
+                    self._log_token_usage(chunk)
+                    return "".join(chunks)
+                if time.monotonic() > deadline:
+                    return None
+
+        return None
+
+    def close(self):
+        """Close the pooled HTTP session."""
+        self.session.close()
+
+    async def aclose(self):
+        """Close the shared async HTTP client, if one was opened."""
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
+            self._aclient_loop = None
 
     def generate_summary(self, results, proposal_title, proposal_text,
                         representative_statements=None, top_concerns=None,
@@ -73,86 +499,122 @@ class HabermasLLMSummarizer:
                 results, proposal_title, top_concerns, representative_statements
             )
 
-        try:
-            # Calculate statistics
-            total = len(results)
-            favorable = sum(1 for r in results if r.get("sentiment") == "favorable")
-            neutral = sum(1 for r in results if r.get("sentiment") == "neutral")
-            unfavorable = sum(1 for r in results if r.get("sentiment") == "unfavorable")
-
-            favorable_pct = round((favorable / total) * 100) if total > 0 else 0
-            neutral_pct = round((neutral / total) * 100) if total > 0 else 0
-            unfavorable_pct = round((unfavorable / total) * 100) if total > 0 else 0
+        # Computed once and shared with the fallback on failure
+        stats = _sentiment_stats(results)
 
-            # Prepare prompt for LLM
-            prompt = self._prepare_summary_prompt(
-                results,
-                proposal_title,
-                proposal_text,
-                representative_statements,
-                top_concerns,
-                department_insights,
-                favorable_pct,
-                neutral_pct,
-                unfavorable_pct
+        try:
+            prompt = self._summary_prompt(
+                results, stats, proposal_title, proposal_text,
+                representative_statements, top_concerns, department_insights
             )
 
+            key = self._cache_key("summary", prompt)
+            cached = self._cache_get(key)
+            if cached is not None:
+                return cached
+
             # Make API call to Ollama
-            response = requests.post(
-                f"{self.base_url}/api/generate",
-                json={
-                    "model": self.model,
-                    "prompt": prompt,
-                    "stream": False,
-                    "options": {
-                        "temperature": 0.2,  # Low temperature for consistency
-                        "top_p": 0.9,
-                        "top_k": 40
-                    }
-                },
-                timeout=20  # Longer timeout for summary generation
-            )
+            generated = self._ollama_stream(prompt, SUMMARY_NUM_PREDICT)
 
-            if response.status_code != 200:
+            if generated is None:
                 return self._generate_fallback_summary(
-                    results, proposal_title, top_concerns, representative_statements
+                    results, proposal_title, top_concerns, representative_statements, stats
                 )
 
-            summary_text = response.json().get("response", "").strip()
+            summary_text = self._finish_summary(generated, proposal_title)
+            self._cache_put(key, summary_text)
+            return summary_text
 
-            # Clean response if needed (remove any system prompt residue)
-            summary_text = re.sub(r'<.*?>', '', summary_text)
+        except Exception:
+            logger.exception("LLM summary generation failed; using fallback")
+            return self._generate_fallback_summary(
+                results, proposal_title, top_concerns, representative_statements, stats
+            )
 
-            # Ensure the summary has a title
-            if not summary_text.startswith('#'):
-                summary_text = f"# Feedback Summary for: {proposal_title}\n\n{summary_text}"
+    async def agenerate_summary(self, results, proposal_title, proposal_text,
+                                representative_statements=None, top_concerns=None,
+                                department_insights=None):
+        """
+        Async version of generate_summary, using a shared httpx.AsyncClient.
 
-            return summary_text
+        Takes the same arguments and returns the same Markdown summary, so
+        several summaries can be awaited concurrently (see generate_all).
 
-        except Exception as e:
-            print(f"Error generating LLM summary: {str(e)}")
-            print(traceback.format_exc())
+        Raises:
+            ImportError: If httpx is not installed
+        """
+        if not self.available or not results:
             return self._generate_fallback_summary(
                 results, proposal_title, top_concerns, representative_statements
             )
 
+        self._async_client()
+
+        # Computed once and shared with the fallback on failure
+        stats = _sentiment_stats(results)
+
+        try:
+            prompt = self._summary_prompt(
+                results, stats, proposal_title, proposal_text,
+                representative_statements, top_concerns, department_insights
+            )
+
+            key = self._cache_key("summary", prompt)
+            cached = self._cache_get(key)
+            if cached is not None:
+                return cached
+
+            generated = await self._aollama_stream(prompt, SUMMARY_NUM_PREDICT)
+
+            if generated is None:
+                return self._generate_fallback_summary(
+                    results, proposal_title, top_concerns, representative_statements, stats
+                )
+
+            summary_text = self._finish_summary(generated, proposal_title)
+            self._cache_put(key, summary_text)
+            return summary_text
+
+        except Exception:
+            logger.exception("LLM summary generation failed; using fallback")
+            return self._generate_fallback_summary(
+                results, proposal_title, top_concerns, representative_statements, stats
+            )
+
+    def _summary_prompt(self, results, stats, proposal_title, proposal_text,
+                        representative_statements, top_concerns, department_insights):
+        """Build the summary prompt from results and their SentimentStats."""
+        return self._prepare_summary_prompt(
+            results,
+            proposal_title,
+            proposal_text,
+            representative_statements,
+            top_concerns,
+            department_insights,
+            stats.favorable_pct,
+            stats.neutral_pct,
+            stats.unfavorable_pct
+        )
+
+    def _finish_summary(self, generated, proposal_title):
+        """Clean a generated summary and make sure it has a title."""
+        summary_text = generated.strip()
+
+        # Clean response if needed (remove any system prompt residue)
+        summary_text = _TAG_RE.sub('', summary_text)
+
+        # Ensure the summary has a title
+        if not _HEADING_START_RE.match(summary_text):
+            summary_text = "".join(["# Feedback Summary for: ", proposal_title, "\n\n", summary_text])
+
+        return summary_text
+
     def _prepare_summary_prompt(self, results, proposal_title, proposal_text,
                                 representative_statements, top_concerns,
                                 department_insights, favorable_pct, neutral_pct,
                                 unfavorable_pct):
         """Prepare a prompt for the LLM summarizer."""
-        prompt = f"""You are an AI assistant helping to analyze and summarize feedback about a proposal. Your task is to create a concise, balanced, and informative summary that emphasizes participant wording while making the content more readable.
-
-The summary should follow these principles:
-1. Prioritize using direct quotations from participants when possible
-2. Present a balanced view that represents all perspectives
-3. Focus on finding common ground and shared concerns
-4. Identify key themes without imposing your own judgments
-5. Make content accessible and clearly organized for various audiences
-
-Here's the information about the proposal:
-
-Title: {proposal_title}
+        parts = [_SUMMARY_INSTRUCTIONS, f"""Title: {proposal_title}
 Description: {proposal_text}
 
 Feedback statistics:
@@ -161,69 +623,60 @@ Feedback statistics:
 - Neutral: {neutral_pct}%
 - Unfavorable: {unfavorable_pct}%
 
-"""
+"""]
 
         # Add top concerns if available
         if top_concerns:
-            prompt += "Top concerns identified:\n"
+            parts.append("Top concerns identified:\n")
             for concern, count in top_concerns:
                 concern_pct = round((count / len(results)) * 100)
-                prompt += f"- {concern}: {concern_pct}% of responses\n"
-            prompt += "\n"
+                parts.append(f"- {concern}: {concern_pct}% of responses\n")
+            parts.append("\n")
 
         # Add department insights if available
         if department_insights and department_insights:
-            prompt += "Department-specific insights:\n"
+            parts.append("Department-specific insights:\n")
             for insight in department_insights:
-                prompt += f"- {insight}\n"
-            prompt += "\n"
+                parts.append(f"- {insight}\n")
+            parts.append("\n")
 
         # Add representative statements if available
         if representative_statements and representative_statements:
-            prompt += "Representative statements from participants:\n"
+            parts.append("Representative statements from participants:\n")
             for stmt in representative_statements:
-                prompt += f'"{stmt}"\n'
-            prompt += "\n"
+                parts.append(f'"{stmt}"\n')
+            parts.append("\n")
 
-        # Sample of all statements for context
+        # Sample of all statements for context (stop scanning once we have enough)
         sample_size = min(5, len(results))
-        sample_statements = [r.get("statement", "") for r in results if "statement" in r][:sample_size]
+        sample_statements = list(islice((r["statement"] for r in results if "statement" in r), sample_size))
 
         if sample_statements:
-            prompt += "Sample of all feedback statements for context:\n"
+            parts.append("Sample of all feedback statements for context:\n")
             for stmt in sample_statements:
-                prompt += f'"{stmt}"\n'
-            prompt += "\n"
-
-        # Instructions for output format
-        prompt += """
-Please create a comprehensive summary with the following sections:
-1. Top level summary of overall reception (positive, negative, or mixed) with most important points
-2. Quick statistics on the feedback breakdown
-3. Key themes and concerns identified
-4. Important insights from the data
-5. Representative quotes that illustrate the key points (use actual quotes from participants)
+                parts.append(f'"{stmt}"\n')
+            parts.append("\n")
 
-Format the summary with Markdown, including appropriate headers. Remember to be balanced and focus on finding consensus while accurately representing diverse perspectives.
-"""
-
-        return prompt
+        return "".join(parts)
 
     def _generate_fallback_summary(self, results, proposal_title,
-                                  top_concerns=None, representative_statements=None):
-        """Generate a fallback summary when LLM is not available."""
+                                  top_concerns=None, representative_statements=None,
+                                  stats=None):
+        """Generate a fallback summary when LLM is not available.
+
+        stats may carry SentimentStats already computed for results, to
+        avoid recounting them.
+        """
         if not results:
             return f"# No Feedback Available for: {proposal_title}\n\nNo simulation results were available to generate a summary."
 
         # Calculate statistics
-        total = len(results)
-        favorable = sum(1 for r in results if r.get("sentiment") == "favorable")
-        neutral = sum(1 for r in results if r.get("sentiment") == "neutral")
-        unfavorable = sum(1 for r in results if r.get("sentiment") == "unfavorable")
-
-        favorable_pct = round((favorable / total) * 100) if total > 0 else 0
-        neutral_pct = round((neutral / total) * 100) if total > 0 else 0
-        unfavorable_pct = round((unfavorable / total) * 100) if total > 0 else 0
+        if stats is None:
+            stats = _sentiment_stats(results)
+        total = stats.total
+        favorable_pct = stats.favorable_pct
+        neutral_pct = stats.neutral_pct
+        unfavorable_pct = stats.unfavorable_pct
 
         # Determine overall sentiment
         sentiment_description = (
@@ -288,93 +741,235 @@ Format the summary with Markdown, including appropriate headers. Remember to be
                 results, suggestion_counts, suggestion_statements, categories
             )
 
+            key = self._cache_key("suggestions", prompt)
+            cached = self._cache_get(key)
+            if cached is not None:
+                return cached
+
             # Make API call to Ollama
-            response = requests.post(
-                f"{self.base_url}/api/generate",
-                json={
-                    "model": self.model,
-                    "prompt": prompt,
-                    "stream": False,
-                    "options": {
-                        "temperature": 0.2,  # Low temperature for consistency
-                        "top_p": 0.9,
-                        "top_k": 40
-                    }
-                },
-                timeout=20  # Longer timeout for summary generation
-            )
+            generated = self._ollama_stream(prompt, SUGGESTIONS_NUM_PREDICT)
 
-            if response.status_code != 200:
+            if generated is None:
                 return self._generate_fallback_suggestions(
                     suggestion_counts, suggestion_statements, categories
                 )
 
-            suggestions_text = response.json().get("response", "").strip()
+            suggestions_text = self._finish_suggestions(generated)
+            self._cache_put(key, suggestions_text)
+            return suggestions_text
+
+        except Exception:
+            logger.exception("LLM suggestions summary generation failed; using fallback")
+            return self._generate_fallback_suggestions(
+                suggestion_counts, suggestion_statements, categories
+            )
+
+    async def agenerate_suggestions_summary(self, results, suggestion_counts,
+                                            suggestion_statements, categories):
+        """
+        Async version of generate_suggestions_summary, using a shared httpx.AsyncClient.
+
+        Raises:
+            ImportError: If httpx is not installed
+        """
+        if not self.available or not results or not suggestion_counts:
+            return self._generate_fallback_suggestions(
+                suggestion_counts, suggestion_statements, categories
+            )
+
+        self._async_client()
+
+        try:
+            prompt = self._prepare_suggestions_prompt(
+                results, suggestion_counts, suggestion_statements, categories
+            )
+
+            key = self._cache_key("suggestions", prompt)
+            cached = self._cache_get(key)
+            if cached is not None:
+                return cached
 
-            # Clean response if needed
-            suggestions_text = re.sub(r'<.*?>', '', suggestions_text)
+            generated = await self._aollama_stream(prompt, SUGGESTIONS_NUM_PREDICT)
 
-            # Ensure the summary has a title
-            if not suggestions_text.startswith('#'):
-                suggestions_text = f"# Improvement Suggestions\n\n{suggestions_text}"
+            if generated is None:
+                return self._generate_fallback_suggestions(
+                    suggestion_counts, suggestion_statements, categories
+                )
 
+            suggestions_text = self._finish_suggestions(generated)
+            self._cache_put(key, suggestions_text)
             return suggestions_text
 
-        except Exception as e:
-            print(f"Error generating LLM suggestions summary: {str(e)}")
-            print(traceback.format_exc())
+        except Exception:
+            logger.exception("LLM suggestions summary generation failed; using fallback")
             return self._generate_fallback_suggestions(
                 suggestion_counts, suggestion_statements, categories
             )
 
+    async def generate_all(self, proposals):
+        """
+        Generate summaries and suggestions summaries for several proposals concurrently.
+
+        All generations are dispatched at once, so network I/O overlaps
+        instead of queueing behind each call. How many the Ollama server
+        actually runs in parallel is set by its OLLAMA_NUM_PARALLEL
+        environment variable; requests beyond that wait server-side.
+
+        Args:
+            proposals: List of dicts, each holding agenerate_summary's keyword
+                arguments (results, proposal_title, proposal_text and optionally
+                representative_statements, top_concerns, department_insights),
+                plus suggestion_counts, suggestion_statements and categories
+                when a suggestions summary is wanted too
+
+        Returns:
+            List of (summary, suggestions_summary) tuples in proposal order;
+            suggestions_summary is None for proposals without suggestion_counts
+
+        Example:
+            >>> summaries = asyncio.run(summarizer.generate_all([
+            ...     {"results": results, "proposal_title": "Remote Fridays",
+            ...      "proposal_text": text},
+            ... ]))
+        """
+        try:
+            outputs = await asyncio.gather(*self._proposal_calls(proposals))
+        finally:
+            # The async client belongs to this event loop, which the caller's
+            # asyncio.run closes on return; a later loop opens a fresh one
+            await self.aclose()
+
+        return self._pair_outputs(proposals, outputs)
+
+    def summarize_many(self, items, max_concurrency=8, on_progress=None,
+                       rate_limit_rps=None):
+        """
+        Summarize many proposals with bounded concurrency (blocking).
+
+        Like generate_all, but caps how many generations are in flight and
+        can report progress and throttle the request rate. Runs its own event
+        loop, so call it from synchronous code.
+
+        Args:
+            items: Proposal dicts, as accepted by generate_all
+            max_concurrency: Maximum generations in flight at once (default: 8)
+            on_progress: Optional callback(done, total) called as each
+                generation finishes
+            rate_limit_rps: Optional cap on generations started per second;
+                requires aiolimiter
+
+        Returns:
+            List of (summary, suggestions_summary) tuples, as from generate_all
+
+        Raises:
+            ImportError: If rate_limit_rps is set and aiolimiter is not installed
+        """
+        if rate_limit_rps is not None and not AIOLIMITER_AVAILABLE:
+            raise ImportError("aiolimiter is required for rate_limit_rps: pip install aiolimiter")
+
+        return asyncio.run(
+            self._summarize_many(items, max_concurrency, on_progress, rate_limit_rps)
+        )
+
+    async def _summarize_many(self, items, max_concurrency, on_progress, rate_limit_rps):
+        """Event-loop body of summarize_many."""
+        semaphore = asyncio.Semaphore(max_concurrency)
+        limiter = AsyncLimiter(rate_limit_rps, 1) if rate_limit_rps is not None else None
+        calls = self._proposal_calls(items)
+        total = len(calls)
+        done = 0
+
+        async def bounded(call):
+            nonlocal done
+            async with semaphore:
+                if limiter is not None:
+                    await limiter.acquire()
+                result = await call
+            done += 1
+            if on_progress is not None:
+                on_progress(done, total)
+            return result
+
+        try:
+            outputs = await asyncio.gather(*(bounded(call) for call in calls))
+        finally:
+            # The async client belongs to this event loop, which asyncio.run
+            # closes on return
+            await self.aclose()
+
+        return self._pair_outputs(items, outputs)
+
+    def _proposal_calls(self, proposals):
+        """
+        Create the (not yet awaited) generations for a list of proposals.
+
+        Returns one agenerate_summary call per proposal, followed by an
+        agenerate_suggestions_summary call for each proposal that has
+        suggestion_counts; _pair_outputs reassembles the results.
+        """
+        summary_calls = [
+            self.agenerate_summary(**{k: p[k] for k in _SUMMARY_KWARGS if k in p})
+            for p in proposals
+        ]
+        suggestion_calls = [
+            self.agenerate_suggestions_summary(
+                p["results"], p["suggestion_counts"],
+                p.get("suggestion_statements", {}), p.get("categories", {})
+            )
+            for p in proposals if "suggestion_counts" in p
+        ]
+        return summary_calls + suggestion_calls
+
+    @staticmethod
+    def _pair_outputs(proposals, outputs):
+        """Group _proposal_calls results into per-proposal (summary, suggestions) tuples."""
+        summaries = outputs[:len(proposals)]
+        suggestions = iter(outputs[len(proposals):])
+
+        return [
+            (summary, next(suggestions) if "suggestion_counts" in p else None)
+            for summary, p in zip(summaries, proposals)
+        ]
+
+    def _finish_suggestions(self, generated):
+        """Clean a generated suggestions summary and make sure it has a title."""
+        suggestions_text = generated.strip()
+
+        # Clean response if needed
+        suggestions_text = _TAG_RE.sub('', suggestions_text)
+
+        # Ensure the summary has a title
+        if not _HEADING_START_RE.match(suggestions_text):
+            suggestions_text = "".join(["# Improvement Suggestions\n\n", suggestions_text])
+
+        return suggestions_text
+
     def _prepare_suggestions_prompt(self, results, suggestion_counts,
                                    suggestion_statements, categories):
         """Prepare a prompt for suggestions summarization."""
-        prompt = """You are an AI assistant helping to summarize improvement suggestions based on feedback about a proposal. Your task is to organize the suggestions into a cohesive, actionable format that emphasizes participant wording.
-
-Follow these principles:
-1. Prioritize using direct language from the original suggestions
-2. Group related suggestions into meaningful categories
-3. Present concrete, actionable recommendations
-4. Use supporting quotes from participants to add context and credibility
-5. Make the content organized and accessible for leadership decision-making
-
-Here's the feedback information:
-"""
+        parts = [_SUGGESTIONS_INSTRUCTIONS]
 
         # Add suggestion counts
-        prompt += f"Total responses: {len(results)}\n"
-        prompt += f"Number of distinct suggestions: {len(suggestion_counts)}\n\n"
+        parts.append(f"Total responses: {len(results)}\n")
+        parts.append(f"Number of distinct suggestions: {len(suggestion_counts)}\n\n")
 
         # Add categorized suggestions
-        prompt += "Suggestions by category:\n"
+        parts.append("Suggestions by category:\n")
         for category, suggestions in categories.items():
             if suggestions:
-                prompt += f"\n{category}:\n"
+                parts.append(f"\n{category}:\n")
                 for suggestion, count in suggestions:
                     percentage = round((count / len(results)) * 100)
-                    prompt += f"- {suggestion} ({percentage}% of respondents)\n"
+                    parts.append(f"- {suggestion} ({percentage}% of respondents)\n")
 
                     # Add supporting statements if available
                     if suggestion in suggestion_statements and suggestion_statements[suggestion]:
                         # Get a sample of statements (up to 2)
-                        sample_statements = suggestion_statements[suggestion][:min(2, len(suggestion_statements[suggestion]))]
+                        sample_statements = suggestion_statements[suggestion][:2]
                         for stmt in sample_statements:
-                            prompt += f'  - "{stmt}"\n'
-
-        # Instructions for output format
-        prompt += """
-Please create a well-organized summary of improvement suggestions with the following sections:
-1. Brief introduction summarizing the overall feedback on improvement areas
-2. Categorized recommendations, organized by theme
-3. Specific actionable items highlighted within each category
-4. Supporting quotes from participants to illustrate key suggestions
-5. A section highlighting the most critical recommendations based on frequency and importance
+                            parts.append(f'  - "{stmt}"\n')
 
-Format the summary with Markdown including appropriate headers, and emphasize the most critical recommendations. Make the suggestions concrete and actionable.
-"""
-
-        return prompt
+        return "".join(parts)
 
     def _generate_fallback_suggestions(self, suggestion_counts,
                                      suggestion_statements, categories):
@@ -382,10 +977,12 @@ Format the summary with Markdown including appropriate headers, and emphasize th
         if not suggestion_counts:
             return "# No Suggestions\n\nNo specific suggestions were provided in the feedback."
 
-        # Find top suggestion
-        top_suggestion = max(
-            suggestion_counts.items(), key=lambda x: x[1], default=("", 0)
-        )
+        # Find top suggestion (Counter.most_common(1) when given a Counter;
+        # both reduce to a single max() pass with a C-level key)
+        if isinstance(suggestion_counts, Counter):
+            top_suggestion = suggestion_counts.most_common(1)[0]
+        else:
+            top_suggestion = max(suggestion_counts.items(), key=itemgetter(1))
 
         # Create basic summary
         suggestions_text = "# Improvement Suggestions\n\n"
@@ -395,11 +992,10 @@ Format the summary with Markdown including appropriate headers, and emphasize th
         section_count = 1
         for category, suggestions in categories.items():
             if suggestions:
-                suggestions = sorted(suggestions, key=lambda x: x[1], reverse=True)
                 suggestions_text += f"## {section_count}. {category} Recommendations\n"
 
-                # Take top 3 per category
-                top_category_suggestions = suggestions[:min(3, len(suggestions))]
+                # Take top 3 per category (same order as a stable descending sort)
+                top_category_suggestions = heapq.nlargest(3, suggestions, key=itemgetter(1))
 
                 for suggestion, count in top_category_suggestions:
                     # Add the suggestion with a supporting quote if available
@@ -20,6 +20,9 @@ from habermas_machine.core.templates import (
     create_ranking_prediction_prompt,
     format_participant_statements,
     format_candidate_statements,
+    build_candidate_view,
+    CandidateView,
+    compile_template,
     validate_candidate_template,
     validate_ranking_template,
     extract_statement_from_response,
@@ -42,6 +45,9 @@ __all__ = [
     'create_ranking_prediction_prompt',
     'format_participant_statements',
     'format_candidate_statements',
+    'build_candidate_view',
+    'CandidateView',
+    'compile_template',
     'validate_candidate_template',
     'validate_ranking_template',
     'extract_statement_from_response',
@@ -14,7 +14,10 @@ by the Free Software Foundation, either version 3 of the License, or
 (at your option) any later version.
 """
 
-from typing import Dict
+import string
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, Tuple, Union
 
 # ============================================================================
 # Default Prompt Templates
@@ -118,6 +121,46 @@ def get_default_templates() -> Dict[str, str]:
     }
 
 
+def compile_template(template: str) -> Callable[..., str]:
+    """
+    Pre-split a str.format template into literal text and field names.
+
+    The returned builder joins the pieces directly, so the template is parsed
+    once instead of on every call. Templates that use positional fields,
+    attribute/index lookups, conversions or format specs fall back to
+    str.format.
+
+    Args:
+        template: Template string using str.format placeholders
+
+    Returns:
+        Function taking the placeholder values as keyword arguments
+    """
+    # Parse the whole template up front so malformed text after a fallback
+    # field still raises here rather than at render time
+    parsed = list(string.Formatter().parse(template))
+    segments = []
+    for literal, field_name, format_spec, conversion in parsed:
+        if field_name is not None and (format_spec or conversion or not field_name.isidentifier()):
+            return template.format
+        segments.append((literal, field_name))
+
+    def build(**fields) -> str:
+        parts = []
+        for literal, field_name in segments:
+            parts.append(literal)
+            if field_name is not None:
+                parts.append(str(fields[field_name]))
+        return "".join(parts)
+
+    return build
+
+
+# Builders for the default templates, compiled once at import
+_DEFAULT_CANDIDATE_BUILDER = compile_template(DEFAULT_CANDIDATE_GENERATION_TEMPLATE)
+_DEFAULT_RANKING_BUILDER = compile_template(DEFAULT_RANKING_PREDICTION_TEMPLATE)
+
+
 # ============================================================================
 # Response Extraction Utilities
 # ============================================================================
@@ -235,14 +278,78 @@ def format_participant_statements(statements: list) -> str:
     return "\n\n".join(f"- {stmt}" for stmt in statements)
 
 
-def format_candidate_statements(statements: list) -> str:
+@dataclass(frozen=True)
+class CandidateView:
+    """
+    Candidate statements preformatted once per round.
+
+    The same candidate list is formatted into every participant's ranking
+    prompt and again when displaying results, so both renderings are built
+    together and shared.
+
+    Attributes:
+        statements: The original candidate statements
+        prompt_blocks: Numbered code blocks used in ranking prompts
+        display_strs: Statements truncated for results display
+        prompt_text: All prompt blocks joined, ready to drop into a template
+    """
+    statements: Tuple[str, ...]
+    prompt_blocks: Tuple[str, ...]
+    display_strs: Tuple[str, ...]
+    prompt_text: str
+
+
+@lru_cache(maxsize=32)
+def build_candidate_view(statements: Tuple[str, ...], display_width: int = 100) -> CandidateView:
+    """
+    Build a CandidateView for a round's candidate statements.
+
+    Results are cached on the statements tuple, so repeated calls within a
+    round return the same view.
+
+    Args:
+        statements: Tuple of candidate statement strings
+        display_width: Maximum characters kept in each display string
+
+    Returns:
+        CandidateView with prompt and display renderings
+
+    Example:
+        >>> view = build_candidate_view(("Option A", "Option B"))
+        >>> view.display_strs
+        ('Option A', 'Option B')
+    """
+    prompt_blocks = tuple(
+        f"```\nSTATEMENT {i}:\n{statement}\n```"
+        for i, statement in enumerate(statements, 1)
+    )
+    display_strs = tuple(
+        statement if len(statement) <= display_width else f"{statement[:display_width]}..."
+        for statement in statements
+    )
+    return CandidateView(
+        statements=tuple(statements),
+        prompt_blocks=prompt_blocks,
+        display_strs=display_strs,
+        prompt_text="\n\n".join(prompt_blocks)
+    )
+
+
+def _as_candidate_view(statements: Union[list, CandidateView]) -> CandidateView:
+    """Return statements as a CandidateView, building (or reusing) one for plain lists."""
+    if isinstance(statements, CandidateView):
+        return statements
+    return build_candidate_view(tuple(statements))
+
+
+def format_candidate_statements(statements: Union[list, CandidateView]) -> str:
     """
     Format a list of candidate statements for ranking prediction.
 
     Each candidate is formatted in a numbered code block for clarity.
 
     Args:
-        statements: List of candidate statement strings
+        statements: List of candidate statement strings, or a prebuilt CandidateView
 
     Returns:
         Formatted string with numbered statements in code blocks
@@ -260,10 +367,7 @@ def format_candidate_statements(statements: list) -> str:
         Option B
         ```
     """
-    formatted = []
-    for i, statement in enumerate(statements, 1):
-        formatted.append(f"```\nSTATEMENT {i}:\n{statement}\n```")
-    return "\n\n".join(formatted)
+    return _as_candidate_view(statements).prompt_text
 
 
 def create_candidate_generation_prompt(
@@ -289,12 +393,10 @@ def create_candidate_generation_prompt(
         >>> "Should voting be compulsory?" in prompt
         True
     """
-    if template is None:
-        template = DEFAULT_CANDIDATE_GENERATION_TEMPLATE
-
     formatted_statements = format_participant_statements(participant_statements)
+    build = _DEFAULT_CANDIDATE_BUILDER if template is None else template.format
 
-    return template.format(
+    return build(
         question=question,
         participant_statements=formatted_statements
     )
@@ -303,7 +405,7 @@ def create_candidate_generation_prompt(
 def create_ranking_prediction_prompt(
     question: str,
     participant_statement: str,
-    candidate_statements: list,
+    candidate_statements: Union[list, CandidateView],
     participant_num: int,
     template: str = None
 ) -> str:
@@ -313,7 +415,8 @@ def create_ranking_prediction_prompt(
     Args:
         question: The question being deliberated
         participant_statement: The participant's original statement
-        candidate_statements: List of candidate consensus statements to rank
+        candidate_statements: List of candidate consensus statements to rank,
+            or a CandidateView built once for the round
         participant_num: The participant's number (for logging/tracking)
         template: Optional custom template (uses default if None)
 
@@ -330,17 +433,15 @@ def create_ranking_prediction_prompt(
         >>> "personal freedom" in prompt
         True
     """
-    if template is None:
-        template = DEFAULT_RANKING_PREDICTION_TEMPLATE
-
-    formatted_candidates = format_candidate_statements(candidate_statements)
+    candidates = _as_candidate_view(candidate_statements)
+    build = _DEFAULT_RANKING_BUILDER if template is None else template.format
 
-    return template.format(
+    return build(
         question=question,
         participant_num=participant_num,
         participant_statement=participant_statement,
-        num_candidates=len(candidate_statements),
-        candidate_statements=formatted_candidates
+        num_candidates=len(candidates.statements),
+        candidate_statements=candidates.prompt_text
     )
 
 
@@ -6,7 +6,7 @@ This package contains:
     - response_parser: Utilities for parsing and validating LLM outputs
 """
 
-from habermas_machine.llm.client import OllamaClient
+from habermas_machine.llm.client import OllamaClient, extract_response_token
 
 from habermas_machine.llm.response_parser import (
     RankingParser,
@@ -21,6 +21,7 @@ from habermas_machine.llm.response_parser import (
 __all__ = [
     # Client
     'OllamaClient',
+    'extract_response_token',
 
     # Parser
     'RankingParser',
@@ -16,12 +16,146 @@ by the Free Software Foundation, either version 3 of the License, or
 
 import json
 import logging
-import requests
+import urllib3
 from typing import Optional, Callable, Dict, Any, Tuple
-from threading import Event
+from threading import Event, Lock
+
+# orjson is optional; it parses the streamed NDJSON frames (as raw bytes)
+# several times faster than the standard library
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# httpx is optional; it is only needed for the async agenerate_streaming API
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# JSON decoder for streamed response lines. orjson.JSONDecodeError subclasses
+# json.JSONDecodeError, so callers only need to catch the latter.
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize a request payload straight to UTF-8 JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+# Headers for pre-serialized generate requests
+_GENERATE_HEADERS = {
+    "Content-Type": "application/json",
+    "Accept": "application/x-ndjson",
+}
+
+# Bytes read from the socket per iteration when streaming
+STREAM_CHUNK_SIZE = 8192
+
+
+def _iter_ndjson_lines(response: urllib3.HTTPResponse, chunk_size: int = STREAM_CHUNK_SIZE):
+    """
+    Yield complete, non-empty NDJSON lines (as bytes) from a streaming response.
+
+    Reads raw chunks with stream() and splits them on newlines with
+    bytearray.find, avoiding any per-line decoding or buffering layers.
+
+    Args:
+        response: Streaming urllib3 response (requested with preload_content=False)
+        chunk_size: Number of bytes to read per chunk
+
+    Yields:
+        Each line of the response body, without the trailing newline
+    """
+    buf = bytearray()
+    for chunk in response.stream(chunk_size):
+        buf += chunk
+        yield from _pop_complete_lines(buf)
+
+    # Final line if the stream didn't end with a newline
+    if buf.strip():
+        yield bytes(buf)
+
+
+def _pop_complete_lines(buf: bytearray) -> list:
+    """
+    Remove every complete line from buf and return the non-empty ones.
+
+    Whatever follows the last newline stays in buf for the next chunk.
+    """
+    lines = []
+    start = 0
+    while True:
+        nl = buf.find(b"\n", start)
+        if nl < 0:
+            break
+        if nl > start:
+            lines.append(bytes(buf[start:nl]))
+        start = nl + 1
+    if start:
+        del buf[:start]
+    return lines
+
+
+# Byte patterns for the fixed shape of Ollama's streamed frames, e.g.
+# {"model":"...","created_at":"...","response":"tok","done":false}
+_RESPONSE_KEY = b'"response":"'
+_DONE_TRUE = b'"done":true'
+_DONE_FALSE = b'"done":false'
+
+
+def extract_response_token(line: bytes) -> Tuple[Optional[str], bool]:
+    """
+    Pull the response token and done flag out of one streamed frame.
+
+    Instead of decoding the whole frame into a dict, this locates the
+    "response" string directly and only decodes that. A quote inside a JSON
+    string is always escaped, so the key patterns can't match inside values.
+    Frames that don't have the expected shape (error frames, unusual
+    formatting) fall back to a full JSON parse.
+
+    Args:
+        line: One NDJSON line from the generate stream
+
+    Returns:
+        Tuple of (token or None, done flag)
+
+    Raises:
+        json.JSONDecodeError: If the fallback parse fails
+    """
+    key_pos = line.find(_RESPONSE_KEY)
+    if key_pos < 0 or (_DONE_TRUE not in line and _DONE_FALSE not in line):
+        data = _json_loads(line)
+        return data.get('response'), bool(data.get('done'))
+
+    start = key_pos + len(_RESPONSE_KEY)
+    end = line.find(b'"', start)
+    # Skip quotes that are escaped (preceded by an odd number of backslashes)
+    while end > 0:
+        backslashes = 0
+        while line[end - 1 - backslashes] == 0x5C:  # backslash
+            backslashes += 1
+        if not backslashes % 2:
+            break
+        end = line.find(b'"', end + 1)
+    if end < 0:
+        data = _json_loads(line)
+        return data.get('response'), bool(data.get('done'))
+
+    raw = line[start:end]
+    if b"\\" in raw:
+        # Let the JSON decoder handle escapes (\n, \", \uXXXX surrogates...)
+        token = _json_loads(line[start - 1:end + 1])
+    else:
+        token = raw.decode("utf-8")
+    return token, _DONE_TRUE in line
+
 
 class OllamaClient:
     """
@@ -40,7 +174,56 @@ class OllamaClient:
         """
         self.base_url = base_url
         self.api_url = f"{base_url}/api/generate"
-        self.current_response: Optional[requests.Response] = None
+        self.current_response: Optional[urllib3.HTTPResponse] = None
+
+        # One keep-alive connection pool for all calls, so repeated generations
+        # reuse the same connection instead of opening a new one each time.
+        # urllib3 is used directly (it is what requests wraps) to skip the
+        # session/adapter/prepared-request layers on every call. Retries are
+        # off to match the previous requests behaviour.
+        self._pool = urllib3.PoolManager(num_pools=2, maxsize=8, retries=False)
+
+        # Guards current_response, which cancel_current_generation() reads
+        # from another thread; _cancel is checked by the streaming loop
+        self._lock = Lock()
+        self._cancel = Event()
+
+    def close(self):
+        """Close the underlying connection pool and its pooled connections."""
+        self._pool.clear()
+
+    def __enter__(self) -> "OllamaClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @staticmethod
+    def _build_payload(
+        model: str,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: float,
+        top_p: float,
+        top_k: int
+    ) -> Dict[str, Any]:
+        """Build the JSON payload for a streaming /api/generate request."""
+        payload: Dict[str, Any] = {
+            "model": model,
+            "prompt": prompt,
+            "stream": True,
+            "options": {
+                "temperature": temperature,
+                "top_p": top_p,
+                "top_k": top_k
+            }
+        }
+
+        # Add system prompt if provided
+        if system_prompt:
+            payload["system"] = system_prompt
+
+        return payload
 
     def generate_streaming(
         self,
@@ -87,58 +270,72 @@ class OllamaClient:
             ...     on_token=print_token
             ... )
         """
+        finished = False
+        response = None
+        self._cancel.clear()
         try:
             # Prepare request payload
-            payload: Dict[str, Any] = {
-                "model": model,
-                "prompt": prompt,
-                "stream": True,
-                "options": {
-                    "temperature": temperature,
-                    "top_p": top_p,
-                    "top_k": top_k
-                }
-            }
-
-            # Add system prompt if provided
-            if system_prompt:
-                payload["system"] = system_prompt
+            payload = self._build_payload(model, prompt, system_prompt, temperature, top_p, top_k)
 
-            # Make the API call
-            self.current_response = requests.post(
+            # Make the API call, streaming the body as it arrives
+            response = self._pool.request(
+                "POST",
                 self.api_url,
-                json=payload,
-                stream=True,
+                body=_json_dumps(payload),
+                headers=_GENERATE_HEADERS,
+                preload_content=False,
                 timeout=300  # 5 minute timeout
             )
+            with self._lock:
+                self.current_response = response
 
             # Check response status
-            if self.current_response.status_code != 200:
-                logger.error(f"Ollama API error: Status {self.current_response.status_code}")
+            if response.status != 200:
+                logger.error(f"Ollama API error: Status {response.status}")
                 return None
 
-            # Stream the response
-            full_response = ""
-            for line in self.current_response.iter_lines():
-                # Check for stop signal
-                if stop_event and stop_event.is_set():
+            # Stream the response, collecting tokens to join once at the end
+            parts = []
+            lines = _iter_ndjson_lines(response)
+
+            # Bind everything the per-line loop touches to locals once
+            extract = extract_response_token
+            append_part = parts.append
+            stop_is_set = stop_event.is_set if stop_event else None
+            cancel_is_set = self._cancel.is_set
+
+            for line in lines:
+                # Check for stop signal or cancel_current_generation()
+                if cancel_is_set() or (stop_is_set is not None and stop_is_set()):
                     logger.info("Generation stopped by user")
                     break
 
-                if line:
-                    try:
-                        data = json.loads(line)
-                        if 'response' in data:
-                            token = data['response']
-                            full_response += token
+                try:
+                    token, done = extract(line)
+                    if token is not None:
+                        append_part(token)
 
-                            # Call token callback if provided
-                            if on_token:
-                                on_token(token)
+                        # Call token callback if provided
+                        if on_token:
+                            on_token(token)
+
+                    # The final frame only carries stats, so stop here
+                    # instead of waiting for the server to end the stream
+                    if done:
+                        finished = True
+                        break
+
+                except json.JSONDecodeError as e:
+                    logger.warning(f"Failed to decode JSON from Ollama: {e}")
+                    continue
 
-                    except json.JSONDecodeError as e:
-                        logger.warning(f"Failed to decode JSON from Ollama: {e}")
-                        continue
+            # After the done frame only the chunked terminator is left, so
+            # consume it to keep the connection reusable
+            if finished:
+                for _ in lines:
+                    pass
+
+            full_response = "".join(parts)
 
             # Call completion callback if provided
             if on_complete:
@@ -146,20 +343,37 @@ class OllamaClient:
 
             return full_response
 
-        except requests.exceptions.Timeout:
-            logger.error("Ollama API request timed out")
+        # NewConnectionError is caught first: in urllib3 1.x it subclasses
+        # ConnectTimeoutError
+        except urllib3.exceptions.NewConnectionError:
+            logger.error("Failed to connect to Ollama API. Is Ollama running?")
             return None
 
-        except requests.exceptions.ConnectionError:
-            logger.error("Failed to connect to Ollama API. Is Ollama running?")
+        except urllib3.exceptions.TimeoutError:
+            logger.error("Ollama API request timed out")
             return None
 
         except Exception as e:
-            logger.error(f"Error in generate_streaming: {e}", exc_info=True)
+            if self._cancel.is_set():
+                # Expected: cancel_current_generation() closed the socket mid-read
+                logger.info("Generation cancelled")
+                return None
+            # Full traceback only when debugging; keeps the common failure path cheap
+            logger.error(f"Error in generate_streaming: {e}", exc_info=logger.isEnabledFor(logging.DEBUG))
             return None
 
         finally:
-            self.current_response = None
+            with self._lock:
+                self.current_response = None
+
+            # Hand the connection back to the pool straight away. A response
+            # that wasn't read to the end (early stop, error status, failure
+            # mid-stream) has its connection closed first so the pool never
+            # reuses a socket with unread data on it.
+            if response is not None:
+                if not finished:
+                    response.close()
+                response.release_conn()
 
     def generate(
         self,
@@ -195,18 +409,121 @@ class OllamaClient:
             top_k=top_k
         )
 
+    async def agenerate_streaming(
+        self,
+        model: str,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.7,
+        top_p: float = 0.9,
+        top_k: int = 40,
+        stop_event: Optional[Event] = None,
+        on_token: Optional[Callable[[str], None]] = None,
+        on_complete: Optional[Callable[[str], None]] = None
+    ) -> Optional[str]:
+        """
+        Async version of generate_streaming(), built on httpx.AsyncClient.
+
+        Independent prompts (e.g. one ranking prediction per participant) can
+        be awaited together so Ollama works on them concurrently instead of
+        one blocking request at a time. Each call opens its own AsyncClient,
+        since an AsyncClient's connections belong to the event loop that
+        opened them and concurrent streams need separate connections anyway.
+
+        Args:
+            Same as generate_streaming(). The task can also be stopped by
+            cancelling it.
+
+        Returns:
+            The complete generated text, or None if an error occurred
+
+        Raises:
+            ImportError: If httpx is not installed
+
+        Example:
+            >>> async def rank_all(client, prompts):
+            ...     return await asyncio.gather(*[
+            ...         client.agenerate_streaming(model="deepseek-r1:14b", prompt=p)
+            ...         for p in prompts
+            ...     ])
+        """
+        if not HTTPX_AVAILABLE:
+            raise ImportError("agenerate_streaming requires httpx (pip install httpx)")
+
+        payload = self._build_payload(model, prompt, system_prompt, temperature, top_p, top_k)
+
+        try:
+            async with httpx.AsyncClient(base_url=self.base_url, timeout=300.0) as client, \
+                    client.stream(
+                        "POST",
+                        "/api/generate",
+                        content=_json_dumps(payload),
+                        headers=_GENERATE_HEADERS
+                    ) as response:
+                if response.status_code != 200:
+                    logger.error(f"Ollama API error: Status {response.status_code}")
+                    return None
+
+                parts = []
+                buf = bytearray()
+                finished = False
+                async for chunk in response.aiter_bytes():
+                    buf += chunk
+                    for line in _pop_complete_lines(buf):
+                        if stop_event is not None and stop_event.is_set():
+                            logger.info("Generation stopped by user")
+                            finished = True
+                            break
+
+                        try:
+                            token, done = extract_response_token(line)
+                        except json.JSONDecodeError as e:
+                            logger.warning(f"Failed to decode JSON from Ollama: {e}")
+                            continue
+
+                        if token is not None:
+                            parts.append(token)
+                            if on_token:
+                                on_token(token)
+                        if done:
+                            finished = True
+                            break
+                    if finished:
+                        break
+
+            full_response = "".join(parts)
+            if on_complete:
+                on_complete(full_response)
+            return full_response
+
+        except httpx.ConnectError:
+            logger.error("Failed to connect to Ollama API. Is Ollama running?")
+            return None
+
+        except httpx.TimeoutException:
+            logger.error("Ollama API request timed out")
+            return None
+
+        except httpx.HTTPError as e:
+            logger.error(f"Error in agenerate_streaming: {e}")
+            return None
+
     def cancel_current_generation(self):
         """
         Cancel the currently running generation.
 
-        This method attempts to close the current HTTP connection to stop
-        an ongoing generation.
+        This signals the streaming loop to stop and closes the current HTTP
+        connection so a read blocked on the next token returns immediately.
+        Safe to call from any thread.
         """
-        if self.current_response:
+        self._cancel.set()
+        with self._lock:
+            response = self.current_response
+        if response is not None:
             try:
-                self.current_response.close()
+                response.close()
                 logger.info("Current generation cancelled")
-            except Exception as e:
+            except (OSError, urllib3.exceptions.HTTPError) as e:
                 logger.warning(f"Error cancelling generation: {e}")
 
     def test_connection(self) -> bool:
@@ -217,9 +534,9 @@ class OllamaClient:
             True if Ollama is running and accessible, False otherwise
         """
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=5)
-            return response.status_code == 200
-        except:
+            response = self._pool.request("GET", f"{self.base_url}/api/tags", timeout=2)
+            return response.status == 200
+        except (urllib3.exceptions.HTTPError, OSError):
             return False
 
     def list_models(self) -> list:
@@ -230,11 +547,12 @@ class OllamaClient:
             List of model names, or empty list if error occurred
         """
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=5)
-            if response.status_code == 200:
-                data = response.json()
+            response = self._pool.request("GET", f"{self.base_url}/api/tags", timeout=5)
+            if response.status == 200:
+                data = json.loads(response.data)
                 return [model['name'] for model in data.get('models', [])]
             return []
-        except Exception as e:
-            logger.error(f"Error listing models: {e}")
+        except (urllib3.exceptions.HTTPError, OSError, ValueError, KeyError) as e:
+            # Ollama not running is an expected state, not an error worth shouting about
+            logger.debug(f"Error listing models: {e}")
             return []
@@ -19,10 +19,38 @@ import re
 import logging
 import ast
 import random
+from functools import lru_cache
 from typing import Optional, List, Tuple, Dict, Any
 
+# orjson is optional; it parses the small ranking objects several times faster
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# numba is optional; when present, validate_ranking's integer loop is JIT-compiled
+# for large rankings
+try:
+    import numba
+    import numpy as np
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch
+# the stdlib exception either way
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# Below this many candidates, converting the ranking to a numpy array costs
+# more than the pure-Python loop saves, so only larger rankings use numba
+NUMBA_MIN_CANDIDATES = 1024
+
+# Characters that matter when scanning for balanced {...} blocks
+_BRACE_SCAN_RE = re.compile(r'[{}"\'\\]')
+
 
 def clean_deepseek_response(response: str) -> str:
     """
@@ -42,9 +70,66 @@ def clean_deepseek_response(response: str) -> str:
         >>> clean_deepseek_response(raw)
         'Here is my answer'
     """
-    # Remove <think>...</think> tags and their contents
-    cleaned = re.sub(r'<think>.*?</think>', '', response, flags=re.DOTALL)
-    return cleaned.strip()
+    # Remove <think>...</think> tags and their contents. The markers are
+    # fixed strings, so splice them out with str.find rather than a regex.
+    # An unclosed <think> is left in place, as the old regex did.
+    if '<think>' not in response:
+        return response.strip()
+
+    parts = []
+    i = 0
+    while True:
+        start = response.find('<think>', i)
+        if start < 0:
+            parts.append(response[i:])
+            break
+        end = response.find('</think>', start + 7)
+        if end < 0:
+            parts.append(response[i:])
+            break
+        parts.append(response[i:start])
+        i = end + 8
+
+    return ''.join(parts).strip()
+
+
+def _iter_brace_blocks(text: str):
+    """
+    Yield each top-level balanced {...} block in text, left to right.
+
+    Braces inside quoted strings (within a block) are ignored, so nested
+    objects and values like "}" don't cut a block short. Only the structural
+    characters are visited, via a precompiled regex, so the scan is linear.
+    """
+    depth = 0
+    start = -1
+    quote = None
+    skip_pos = -1
+
+    for match in _BRACE_SCAN_RE.finditer(text):
+        pos = match.start()
+        ch = match.group()
+
+        if quote is not None:
+            if pos == skip_pos:
+                continue  # Escaped character
+            if ch == '\\':
+                skip_pos = pos + 1
+            elif ch == quote:
+                quote = None
+        elif ch == '{':
+            if depth == 0:
+                start = pos
+            depth += 1
+        elif ch == '}':
+            if depth:
+                depth -= 1
+                if depth == 0:
+                    yield text[start:pos + 1]
+        elif depth and ch != '\\':
+            # Quotes only open strings inside a block; outside, an
+            # apostrophe is just prose
+            quote = ch
 
 
 def extract_json_from_text(text: str) -> Optional[Dict[str, Any]]:
@@ -52,7 +137,8 @@ def extract_json_from_text(text: str) -> Optional[Dict[str, Any]]:
     Extract a JSON object from text that may contain additional content.
 
     LLMs often generate explanatory text before/after JSON. This function
-    attempts to find and extract the JSON object using regex.
+    scans for balanced {...} blocks (so nested objects are kept whole) and
+    returns the first one that parses.
 
     Args:
         text: Text potentially containing a JSON object
@@ -65,24 +151,26 @@ def extract_json_from_text(text: str) -> Optional[Dict[str, Any]]:
         >>> extract_json_from_text(text)
         {'ranking': [1, 2, 3]}
     """
-    # Try to find a JSON object pattern in the text
-    match = re.search(r'({[\s\S]*?})', text)
-    if not match:
-        return None
-
-    json_str = match.group(1)
-
-    # Try json.loads first (standard JSON)
-    try:
-        return json.loads(json_str)
-    except json.JSONDecodeError:
-        pass
-
-    # Try ast.literal_eval as fallback (Python dict syntax)
-    try:
-        return ast.literal_eval(json_str)
-    except (ValueError, SyntaxError):
-        pass
+    # Fast path: a response that is nothing but a JSON object needs no scan
+    stripped = text.strip()
+    if stripped.startswith('{') and stripped.endswith('}'):
+        try:
+            return _json_loads(stripped)
+        except json.JSONDecodeError:
+            pass
+
+    for json_str in _iter_brace_blocks(text):
+        # Try JSON first (standard JSON)
+        try:
+            return _json_loads(json_str)
+        except json.JSONDecodeError:
+            pass
+
+        # Try ast.literal_eval as fallback (Python dict syntax)
+        try:
+            return ast.literal_eval(json_str)
+        except (ValueError, SyntaxError, TypeError, MemoryError, RecursionError):
+            pass
 
     return None
 
@@ -119,8 +207,46 @@ def validate_ranking(
     if len(ranking) != num_candidates:
         return False
 
-    expected_indices = set(range(num_candidates) if zero_indexed else range(1, num_candidates + 1))
-    return set(ranking) == expected_indices
+    offset = 0 if zero_indexed else 1
+    if NUMBA_AVAILABLE and num_candidates >= NUMBA_MIN_CANDIDATES:
+        # Only integer rankings go through the compiled core; anything else
+        # keeps the pure-Python semantics
+        arr = np.asarray(ranking)
+        if arr.ndim == 1 and arr.dtype.kind in 'iu':
+            return bool(_validate_ranking_core_jit(arr.astype(np.int64), num_candidates, offset))
+
+    return _validate_ranking_core(ranking, num_candidates, offset)
+
+
+def _validate_ranking_core(ranking: List[int], num_candidates: int, offset: int) -> bool:
+    """Check that ranking holds each of offset..offset+num_candidates-1 exactly once."""
+    # Set one bit per index seen; a duplicate or out-of-range index fails early
+    mask = 0
+    for index in ranking:
+        bit = index - offset
+        if bit < 0 or bit >= num_candidates:
+            return False
+        flag = 1 << bit
+        if mask & flag:
+            return False
+        mask |= flag
+
+    return True
+
+
+if NUMBA_AVAILABLE:
+    @numba.njit(cache=True)
+    def _validate_ranking_core_jit(ranking, num_candidates, offset):
+        """Compiled _validate_ranking_core over an int64 array."""
+        seen = np.zeros(num_candidates, dtype=np.bool_)
+        for index in ranking:
+            slot = index - offset
+            if slot < 0 or slot >= num_candidates:
+                return False
+            if seen[slot]:
+                return False
+            seen[slot] = True
+        return True
 
 
 def parse_ranking_response(
@@ -153,6 +279,25 @@ def parse_ranking_response(
         >>> ranking
         [0, 1, 2]  # Converted from 1-indexed to 0-indexed
     """
+    ranking, log_msg = _parse_ranking_cached(response, num_candidates, max_retries, attempt_num)
+    return (list(ranking) if ranking is not None else None), log_msg
+
+
+@lru_cache(maxsize=512)
+def _parse_ranking_cached(
+    response: str,
+    num_candidates: int,
+    max_retries: int,
+    attempt_num: int
+) -> Tuple[Optional[Tuple[int, ...]], str]:
+    """
+    Cached implementation of parse_ranking_response.
+
+    Parsing is a pure function of its arguments, and identical responses
+    recur (e.g. re-ranking the same candidates at temperature 0), so results
+    are memoized. Rankings are returned as tuples so cached values can't be
+    mutated by callers.
+    """
     # Clean DeepSeek artifacts
     clean_response = clean_deepseek_response(response)
 
@@ -178,16 +323,32 @@ def parse_ranking_response(
     except (ValueError, TypeError):
         return None, f"Attempt {attempt_num}/{max_retries}: Ranking contains non-integer values"
 
+    # Classify the ranking as 1-indexed, 0-indexed or invalid in a single pass:
+    # collect a bitmask of the values, which must all lie in 0..n
+    is_one_indexed = is_zero_indexed = False
+    if len(ranking) == num_candidates:
+        mask = 0
+        for x in ranking:
+            if x < 0 or x > num_candidates:
+                mask = -1
+                break
+            mask |= 1 << x
+        # n distinct values out of 0..n means exactly one value is missing:
+        # 0 for a 1-indexed ranking, n for a 0-indexed one
+        if mask >= 0 and bin(mask).count("1") == num_candidates:
+            is_one_indexed = not mask & 1
+            is_zero_indexed = not (mask >> num_candidates) & 1
+
     # Check if it's 1-indexed (as expected from the prompt)
-    if validate_ranking(ranking, num_candidates, zero_indexed=False):
+    if is_one_indexed:
         # Convert from 1-indexed to 0-indexed
-        ranking_zero_indexed = [x - 1 for x in ranking]
+        ranking_zero_indexed = tuple(x - 1 for x in ranking)
         return ranking_zero_indexed, f"Attempt {attempt_num}/{max_retries}: Success! Valid ranking: {ranking}"
 
     # Check if it's already 0-indexed
-    if validate_ranking(ranking, num_candidates, zero_indexed=True):
-        logger.warning(f"Model returned 0-indexed ranking (expected 1-indexed): {ranking}")
-        return ranking, f"Attempt {attempt_num}/{max_retries}: Success (0-indexed ranking): {ranking}"
+    if is_zero_indexed:
+        logger.warning("Model returned 0-indexed ranking (expected 1-indexed): %s", ranking)
+        return tuple(ranking), f"Attempt {attempt_num}/{max_retries}: Success (0-indexed ranking): {ranking}"
 
     # Invalid ranking
     return None, f"Attempt {attempt_num}/{max_retries}: Invalid ranking indices: {ranking}"
@@ -211,9 +372,39 @@ def create_random_ranking(num_candidates: int) -> List[int]:
         >>> create_random_ranking(3)
         [1, 0, 2]  # Random order
     """
-    ranking = list(range(num_candidates))
-    random.shuffle(ranking)
-    return ranking
+    return random.sample(range(num_candidates), num_candidates)
+
+
+@lru_cache(maxsize=16)
+def _ranking_system_prompt_parts(num_candidates: int) -> Tuple[str, str, int]:
+    """
+    Build the invariant parts of the ranking system prompt once per size.
+
+    Returns:
+        Tuple of (text before the example ranking, text after it, example size)
+    """
+    # Use a non-biasing example with a different number of candidates
+    example_size = max(3, num_candidates - 1)
+
+    head = f"""You are a helpful assistant that predicts how a person would rank options based on their stated views.
+
+Your task is to output ONLY a JSON object with this exact format:
+
+{{"ranking": [1, 2, 3, ...]}}
+
+The "ranking" should be a list of {num_candidates} numbers from 1 to {num_candidates}, where:
+- The first number is the most preferred option
+- The last number is the least preferred option
+- Each number from 1 to {num_candidates} appears exactly once
+
+Example (for {example_size} options):
+{{"ranking": """
+
+    tail = """}
+
+Do not include any explanation, just output the JSON object."""
+
+    return head, tail, example_size
 
 
 def create_ranking_system_prompt(num_candidates: int) -> str:
@@ -221,7 +412,8 @@ def create_ranking_system_prompt(num_candidates: int) -> str:
     Create a system prompt instructing the model to output JSON rankings.
 
     This prompt provides clear instructions and a randomized example to
-    avoid biasing the model toward any particular ranking.
+    avoid biasing the model toward any particular ranking. The fixed text is
+    cached per num_candidates; only the example is regenerated per call.
 
     Args:
         num_candidates: Number of candidates being ranked
@@ -236,28 +428,13 @@ def create_ranking_system_prompt(num_candidates: int) -> str:
         >>> "ranking" in prompt
         True
     """
-    # Generate a non-biasing example with a different number of candidates
-    example_size = max(3, num_candidates - 1)
-    example_ranking = list(range(1, example_size + 1))
-    random.shuffle(example_ranking)  # Randomize to avoid bias
-
-    prompt = f"""You are a helpful assistant that predicts how a person would rank options based on their stated views.
-
-Your task is to output ONLY a JSON object with this exact format:
-
-{{"ranking": [1, 2, 3, ...]}}
-
-The "ranking" should be a list of {num_candidates} numbers from 1 to {num_candidates}, where:
-- The first number is the most preferred option
-- The last number is the least preferred option
-- Each number from 1 to {num_candidates} appears exactly once
+    head, tail, example_size = _ranking_system_prompt_parts(num_candidates)
 
-Example (for {example_size} options):
-{{"ranking": {example_ranking}}}
-
-Do not include any explanation, just output the JSON object."""
+    # Randomize the example ranking to avoid bias
+    example_ranking = list(range(1, example_size + 1))
+    random.shuffle(example_ranking)
 
-    return prompt
+    return f"{head}{example_ranking}{tail}"
 
 
 class RankingParser:
@@ -278,6 +455,19 @@ class RankingParser:
         self.num_candidates = num_candidates
         self.max_retries = max_retries
         self.attempts_log: List[str] = []
+        self._system_prompt: Optional[str] = None
+
+    @property
+    def system_prompt(self) -> str:
+        """
+        Ranking system prompt for this parser's candidate count.
+
+        Built once per parser, so every attempt in a prediction (and every
+        prediction sharing the parser) reuses the same string.
+        """
+        if self._system_prompt is None:
+            self._system_prompt = create_ranking_system_prompt(self.num_candidates)
+        return self._system_prompt
 
     def parse(
         self,
@@ -304,12 +494,22 @@ class RankingParser:
         self.attempts_log.append(log_msg)
 
         if ranking is not None:
-            logger.info(f"Successfully parsed ranking on attempt {attempt_num}")
+            logger.info("Successfully parsed ranking on attempt %d", attempt_num)
         else:
-            logger.warning(f"Failed to parse ranking on attempt {attempt_num}: {log_msg}")
+            logger.warning("Failed to parse ranking on attempt %d: %s", attempt_num, log_msg)
 
         return ranking
 
+    @staticmethod
+    def cache_info():
+        """
+        Hit/miss statistics for the shared ranking-response parse cache.
+
+        Returns:
+            functools.lru_cache CacheInfo (hits, misses, maxsize, currsize)
+        """
+        return _parse_ranking_cached.cache_info()
+
     def get_fallback_ranking(self) -> Tuple[List[int], List[str]]:
         """
         Get a random fallback ranking when all attempts fail.
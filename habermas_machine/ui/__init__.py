@@ -3,8 +3,16 @@ UI components for the Habermas Machine.
 
 Note: UI components are still in habermas_machine_app.py
       This package is prepared for future modularization.
-"""
 
-from .enhanced_textbox import EnhancedTextbox
+Components are imported lazily on first access, so importing this package
+does not load customtkinter/tkinter until a widget is actually used.
+"""
 
 __all__ = ["EnhancedTextbox"]
+
+
+def __getattr__(name):
+    if name == "EnhancedTextbox":
+        from .enhanced_textbox import EnhancedTextbox
+        return EnhancedTextbox
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -12,6 +12,9 @@ by the Free Software Foundation, either version 3 of the License, or
 import customtkinter as ctk
 import tkinter as tk
 
+# Zebra tag for a line, indexed by line_num & 1
+_PARITY_TAGS = ("even_line", "odd_line")
+
 
 class EnhancedTextbox(ctk.CTkTextbox):
     """
@@ -34,6 +37,11 @@ class EnhancedTextbox(ctk.CTkTextbox):
         """
         super().__init__(master, **kwargs)
 
+        # Lines touched since the last styling pass, as (first, last), and the
+        # line count that pass saw; together they bound what needs retagging
+        self._dirty_range = None
+        self._styled_line_count = 0
+
         self.line_spacing = line_spacing
         self.line_padding = line_padding
         self.horizontal_padding = horizontal_padding
@@ -57,8 +65,8 @@ class EnhancedTextbox(ctk.CTkTextbox):
         self.bind("<KeyRelease>", lambda e: self._schedule_update())
         self.bind("<ButtonRelease-1>", lambda e: self._schedule_update())
 
-        # Track if we need to update styling
-        self._update_pending = False
+        # Handle of the pending styling callback, if any
+        self._update_job = None
 
     def _configure_tags(self):
         """Configure text tags for visual styling."""
@@ -92,11 +100,32 @@ class EnhancedTextbox(ctk.CTkTextbox):
             rmargin=self.horizontal_padding
         )
 
+    def _line_of(self, index):
+        """Return the 1-based line number of a Tk text index."""
+        return int(self._textbox.index(index).split(".")[0])
+
+    def _mark_dirty(self, first_line, last_line):
+        """Record lines needing restyling, coalescing with any pending range."""
+        if self._dirty_range is None:
+            self._dirty_range = (first_line, last_line)
+        else:
+            pending_first, pending_last = self._dirty_range
+            self._dirty_range = (min(pending_first, first_line), max(pending_last, last_line))
+
     def _schedule_update(self):
-        """Schedule a styling update (debounced)."""
-        if not self._update_pending:
-            self._update_pending = True
-            self.after(50, self._apply_line_styling)
+        """Schedule a styling update (debounced).
+
+        Re-arms a single timer on every call, so a burst of keystrokes
+        produces one styling pass 50ms after the burst ends.
+        """
+        if self._update_job is not None:
+            self.after_cancel(self._update_job)
+        self._update_job = self.after(50, self._run_scheduled_update)
+
+    def _run_scheduled_update(self):
+        """Timer callback for _schedule_update."""
+        self._update_job = None
+        self._apply_line_styling()
 
     def _on_text_modified(self, event):
         """Handle text modification events."""
@@ -106,47 +135,84 @@ class EnhancedTextbox(ctk.CTkTextbox):
         except tk.TclError:
             pass
 
+        # Edits made through insert()/delete() have already recorded their
+        # range; anything else (typing, paste, undo) happened at the cursor.
+        # If lines were added, the edit started that many lines above it.
+        if self._dirty_range is None:
+            cursor_line = self._line_of("insert")
+            added = max(self._line_of("end-1c") - self._styled_line_count, 0)
+            self._mark_dirty(max(cursor_line - added, 1), cursor_line)
+
         self._schedule_update()
 
-    def _apply_line_styling(self):
-        """Apply zebra striping and spacing to all lines."""
-        self._update_pending = False
+    def _apply_line_styling(self, full=False):
+        """
+        Apply zebra striping and spacing to the lines touched since the last pass.
 
-        # Remove all existing tags
-        self._textbox.tag_remove("even_line", "1.0", "end")
-        self._textbox.tag_remove("odd_line", "1.0", "end")
-        self._textbox.tag_remove("empty_line", "1.0", "end")
+        When an edit changed the number of lines, every line below it shifted
+        parity, so the window is extended to the end of the buffer.
 
+        Args:
+            full: Retag every line regardless of what is dirty (default: False)
+        """
         # Get total number of lines
-        end_line = int(self._textbox.index("end-1c").split(".")[0])
+        end_line = self._line_of("end-1c")
+        dirty, self._dirty_range = self._dirty_range, None
+        line_count_changed = end_line != self._styled_line_count
+        self._styled_line_count = end_line
+
+        if full or (dirty is None and line_count_changed):
+            first_line, last_line = 1, end_line
+        elif dirty is None:
+            return  # Nothing was edited
+        else:
+            first_line, last_line = dirty
+            if line_count_changed:
+                last_line = end_line
+            first_line = max(1, min(first_line, end_line))
+            last_line = min(last_line, end_line)
+
+        # Remove existing tags within the window
+        window_start = f"{first_line}.0"
+        window_end = f"{last_line}.end"
+        self._textbox.tag_remove("even_line", window_start, window_end)
+        self._textbox.tag_remove("odd_line", window_start, window_end)
+        self._textbox.tag_remove("empty_line", window_start, window_end)
+
+        # Fetch the window in one Tk call and split it here rather than
+        # calling get() once per line
+        lines = self._textbox.get(window_start, window_end).split("\n")
 
         # Apply tags to each line
-        for line_num in range(1, end_line + 1):
+        for line_num, line_content in enumerate(lines, start=first_line):
             line_start = f"{line_num}.0"
             line_end = f"{line_num}.end"
 
-            # Check if line is empty
-            line_content = self._textbox.get(line_start, line_end)
-
             if line_content.strip():  # Non-empty line
                 # Apply zebra striping
-                tag = "even_line" if line_num % 2 == 0 else "odd_line"
-                self._textbox.tag_add(tag, line_start, line_end)
+                self._textbox.tag_add(_PARITY_TAGS[line_num & 1], line_start, line_end)
             else:  # Empty line
                 self._textbox.tag_add("empty_line", line_start, line_end)
 
     def insert(self, index, text, tags=None):
         """Override insert to apply styling after insertion."""
+        # "end" resolves past the final newline, one line below where Tk
+        # actually puts the text, so clamp to the last real line
+        first_line = min(self._line_of(index), self._line_of("end-1c"))
         super().insert(index, text, tags)
+        last_line = min(first_line + text.count("\n"), self._line_of("end-1c"))
+        self._mark_dirty(first_line, last_line)
         self._schedule_update()
 
     def delete(self, start, end=None):
         """Override delete to apply styling after deletion."""
+        first_line = self._line_of(start)
         super().delete(start, end)
+        self._mark_dirty(first_line, first_line)
         self._schedule_update()
 
     def update_colors(self, zebra_colors):
         """Update zebra stripe colors and refresh display."""
         self.zebra_colors = zebra_colors
         self._configure_tags()
-        self._apply_line_styling()
+        self._apply_line_styling(full=True)
@@ -15,12 +15,20 @@ by the Free Software Foundation, either version 3 of the License, or
 """
 
 import logging
+import re
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Set
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns for statement parsing and filename sanitizing
+# List prefixes like "1.", "1)", "-", "*", "•"
+_LIST_PREFIX_RE = re.compile(r'^(\d+[\.\)]|\-|\*|\•)\s+')
+_MULTI_US_RE = re.compile(r'_+')
+# Characters invalid in filenames on common platforms, mapped to underscores
+_SANITIZE_TABLE = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+
 
 def generate_session_id() -> str:
     """
@@ -37,6 +45,55 @@ def generate_session_id() -> str:
     return datetime.now().strftime("%Y%m%d_%H%M%S")
 
 
+# Output directories already created this session, so repeated saves skip the mkdir
+_ensured_dirs: Set[Path] = set()
+
+
+def _save_markdown(
+    content: str,
+    session_id: str,
+    output_dir: str,
+    prefix: str,
+    description: str
+) -> Optional[Path]:
+    """
+    Write content to <output_dir>/<prefix><session_id>.md.
+
+    Shared implementation of the save_* functions below.
+
+    Args:
+        content: The markdown content to save
+        session_id: Unique session identifier
+        output_dir: Directory to save file in
+        prefix: Filename prefix, e.g. "habermas_results_"
+        description: What is being saved, for log messages
+
+    Returns:
+        Path to saved file, or None if save failed
+    """
+    try:
+        output_dir = Path(output_dir)
+        filepath = output_dir / f"{prefix}{session_id}.md"
+
+        if output_dir not in _ensured_dirs:
+            output_dir.mkdir(parents=True, exist_ok=True)
+            _ensured_dirs.add(output_dir)
+
+        try:
+            filepath.write_text(content, encoding='utf-8')
+        except FileNotFoundError:
+            # Directory was removed since we created it; recreate and retry
+            output_dir.mkdir(parents=True, exist_ok=True)
+            filepath.write_text(content, encoding='utf-8')
+
+        logger.info(f"Saved {description} to {filepath}")
+        return filepath
+
+    except Exception as e:
+        logger.error(f"Failed to save {description}: {e}", exc_info=True)
+        return None
+
+
 def save_friendly_output(
     content: str,
     session_id: str,
@@ -59,21 +116,7 @@ def save_friendly_output(
         >>> path.name
         'habermas_results_20250129_120000.md'
     """
-    try:
-        output_dir = Path(output_dir)
-        output_dir.mkdir(parents=True, exist_ok=True)
-
-        filepath = output_dir / f"habermas_results_{session_id}.md"
-
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
-
-        logger.info(f"Saved friendly output to {filepath}")
-        return filepath
-
-    except Exception as e:
-        logger.error(f"Failed to save friendly output: {e}", exc_info=True)
-        return None
+    return _save_markdown(content, session_id, output_dir, "habermas_results_", "friendly output")
 
 
 def save_detailed_output(
@@ -100,21 +143,7 @@ def save_detailed_output(
         >>> path.name
         'habermas_detailed_20250129_120000.md'
     """
-    try:
-        output_dir = Path(output_dir)
-        output_dir.mkdir(parents=True, exist_ok=True)
-
-        filepath = output_dir / f"habermas_detailed_{session_id}.md"
-
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
-
-        logger.info(f"Saved detailed output to {filepath}")
-        return filepath
-
-    except Exception as e:
-        logger.error(f"Failed to save detailed output: {e}", exc_info=True)
-        return None
+    return _save_markdown(content, session_id, output_dir, "habermas_detailed_", "detailed output")
 
 
 def save_recursive_results(
@@ -133,21 +162,7 @@ def save_recursive_results(
     Returns:
         Path to saved file, or None if save failed
     """
-    try:
-        output_dir = Path(output_dir)
-        output_dir.mkdir(parents=True, exist_ok=True)
-
-        filepath = output_dir / f"habermas_recursive_results_{session_id}.md"
-
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
-
-        logger.info(f"Saved recursive results to {filepath}")
-        return filepath
-
-    except Exception as e:
-        logger.error(f"Failed to save recursive results: {e}", exc_info=True)
-        return None
+    return _save_markdown(content, session_id, output_dir, "habermas_recursive_results_", "recursive results")
 
 
 def save_recursive_detailed(
@@ -166,21 +181,7 @@ def save_recursive_detailed(
     Returns:
         Path to saved file, or None if save failed
     """
-    try:
-        output_dir = Path(output_dir)
-        output_dir.mkdir(parents=True, exist_ok=True)
-
-        filepath = output_dir / f"habermas_recursive_detailed_{session_id}.md"
-
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
-
-        logger.info(f"Saved detailed recursive log to {filepath}")
-        return filepath
-
-    except Exception as e:
-        logger.error(f"Failed to save recursive detailed log: {e}", exc_info=True)
-        return None
+    return _save_markdown(content, session_id, output_dir, "habermas_recursive_detailed_", "detailed recursive log")
 
 
 def load_participant_statements_from_file(filepath: str) -> List[str]:
@@ -213,18 +214,13 @@ def load_participant_statements_from_file(filepath: str) -> List[str]:
     if not filepath.exists():
         raise FileNotFoundError(f"File not found: {filepath}")
 
-    statements = []
-
-    with open(filepath, 'r', encoding='utf-8') as f:
-        for line in f:
-            # Strip whitespace
-            line = line.strip()
-
-            # Skip empty lines and comments
-            if not line or line.startswith('#'):
-                continue
-
-            statements.append(line)
+    # Read in one go (newlines are normalized to \n), then strip each line
+    # and skip empty lines and comments
+    text = filepath.read_text(encoding='utf-8')
+    statements = [
+        line for line in (raw.strip() for raw in text.split('\n'))
+        if line and not line.startswith('#')
+    ]
 
     if not statements:
         raise ValueError(f"No valid statements found in {filepath}")
@@ -259,14 +255,15 @@ def export_statements_to_file(
         filepath = Path(filepath)
         filepath.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            if include_header:
-                f.write("# Participant Statements\n")
-                f.write("# One statement per line\n")
-                f.write("# Lines starting with # are ignored\n\n")
+        header = (
+            "# Participant Statements\n"
+            "# One statement per line\n"
+            "# Lines starting with # are ignored\n\n"
+        ) if include_header else ""
+        body = "\n".join(statements) + "\n" if statements else ""
 
-            for statement in statements:
-                f.write(f"{statement}\n")
+        # Build the file once and write it in a single call
+        filepath.write_text(header + body, encoding='utf-8')
 
         logger.info(f"Exported {len(statements)} statements to {filepath}")
         return filepath
@@ -301,26 +298,13 @@ def parse_bulk_import_text(text: str) -> List[str]:
         >>> parse_bulk_import_text(text)
         ['First statement', 'Second statement', 'Third statement']
     """
-    statements = []
-
-    for line in text.split('\n'):
-        # Strip whitespace
-        line = line.strip()
+    strip_prefix = _LIST_PREFIX_RE.sub
 
-        # Skip empty lines and comments
-        if not line or line.startswith('#'):
-            continue
-
-        # Remove common list prefixes
-        # Match patterns like: "1.", "1)", "-", "*", "•"
-        import re
-        line = re.sub(r'^(\d+[\.\)]|\-|\*|\•)\s+', '', line)
-
-        # Only add if there's still content
-        if line:
-            statements.append(line)
-
-    return statements
+    # Strip whitespace, skip empty lines and comments, then remove common
+    # list prefixes, keeping only lines that still have content
+    stripped = (line.strip() for line in text.split('\n'))
+    cleaned = (strip_prefix('', line) for line in stripped if line and not line.startswith('#'))
+    return [line for line in cleaned if line]
 
 
 def sanitize_filename(filename: str) -> str:
@@ -337,11 +321,8 @@ def sanitize_filename(filename: str) -> str:
         >>> sanitize_filename("My File: Test?")
         'My_File_Test'
     """
-    import re
-    # Replace invalid characters with underscores
-    sanitized = re.sub(r'[<>:"/\\|?*]', '_', filename)
-    # Remove leading/trailing spaces and dots
-    sanitized = sanitized.strip('. ')
+    # Replace invalid characters with underscores, then remove
+    # leading/trailing spaces and dots
+    sanitized = filename.translate(_SANITIZE_TABLE).strip('. ')
     # Collapse multiple underscores
-    sanitized = re.sub(r'_+', '_', sanitized)
-    return sanitized
+    return _MULTI_US_RE.sub('_', sanitized)
@@ -22,6 +22,7 @@ import tkinter.messagebox as messagebox
 import traceback
 import sys
 import os
+import io
 import logging
 
 # Set up logging
@@ -52,13 +53,18 @@ except ImportError:
 try:
     import json
     import requests
-    from threading import Thread, Event
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    from threading import Thread, Event, Lock
+    from concurrent.futures import ThreadPoolExecutor, as_completed
     import time
     import random
     import re
-    from collections import defaultdict
+    import string
+    from collections import defaultdict, deque, OrderedDict
     import math
     import datetime
+    import numpy as np
 except ImportError as e:
     # Show message box for other missing dependencies
     root = tk.Tk()
@@ -70,6 +76,22 @@ except ImportError as e:
     )
     sys.exit(1)
 
+# orjson is optional; it decodes the streamed NDJSON lines several times faster
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers only need
+# to catch the latter
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# Parsing helpers shared with the habermas_machine package
+from habermas_machine.core.templates import compile_template
+from habermas_machine.llm.client import extract_response_token
+from habermas_machine.llm.response_parser import clean_deepseek_response
+
 # Try importing the new model management system
 try:
     from habermas_machine.core import (
@@ -98,6 +120,64 @@ except ImportError as e:
     logger.warning(f"Enhanced UI components not available: {e}")
     logger.warning("Continuing with standard textboxes")
 
+# Maximum number of ranking predictions kept in the in-memory cache
+RANKING_CACHE_SIZE = 512
+
+# How long Ollama keeps the model (and its prompt cache) loaded between requests
+OLLAMA_KEEP_ALIVE = "10m"
+
+# Concurrent candidate/ranking requests; Ollama batches parallel decodes.
+# Follows the server's OLLAMA_NUM_PARALLEL when set, since requests beyond
+# that only wait in Ollama's queue while holding a worker thread
+try:
+    MAX_CONCURRENT_REQUESTS = max(1, int(os.environ.get("OLLAMA_NUM_PARALLEL", "4")))
+except ValueError:
+    MAX_CONCURRENT_REQUESTS = 4
+
+# After an unparseable ranking reply, re-ask for just the JSON at temperature 0
+# (up to this many times) rather than repeating the full sampled request
+MAX_JSON_REPAIR_RETRIES = 2
+JSON_REPAIR_SUFFIX = (
+    "\n\nYour previous reply was:\n{previous}\n\n"
+    "Output ONLY the JSON object with the ranking, nothing else."
+)
+
+# While a run is active, re-send an empty load request this often so Ollama
+# doesn't evict a model that sits idle during a long phase (must stay below
+# OLLAMA_KEEP_ALIVE)
+KEEP_WARM_INTERVAL = 4 * 60 * 1000  # milliseconds
+
+# (connect, read) timeouts for Ollama requests; the read timeout bounds the gap
+# between streamed chunks, not the whole generation
+OLLAMA_TIMEOUT = (5, 600)
+
+# Response-parsing patterns, compiled once rather than looked up per call
+# A complete {"ranking": [...]} object; once streamed, the rest of the reply is not needed
+RANKING_OBJECT_RE = re.compile(r'\{\s*"ranking"\s*:\s*\[[\d,\s]*\]\s*\}')
+FIRST_OBJECT_RE = re.compile(r'{[\s\S]*?}')
+STATEMENT_SECTION_RE = re.compile(r'---STATEMENT---\s*(.+)', re.DOTALL | re.IGNORECASE)
+TRAILING_MARKER_RE = re.compile(r'\s*---\w+---.*$', re.DOTALL)
+LEADING_REASONING_RE = re.compile(r'^---REASONING---.*?(?=---STATEMENT---|$)', re.DOTALL | re.IGNORECASE)
+
+# Delay before recounting participants after the last keystroke (ms)
+PARTICIPANT_COUNT_DELAY = 150
+
+# How often queued log text and debug views are pushed into the widgets (ms)
+LOG_FLUSH_INTERVAL = 50
+
+# Output textboxes keep only their most recent lines on screen; once they pass
+# the limit by OUTPUT_TRIM_LINES the oldest lines are dropped in one delete.
+# The complete text is kept in friendly_log/detailed_log for saving.
+OUTPUT_MAX_LINES = 2000
+OUTPUT_TRIM_LINES = 200
+
+# Tag on sections prepended to an output textbox (winner/consensus banners);
+# trimming starts below the last of them so they stay on screen
+OUTPUT_PINNED_TAG = "pinned"
+
+# Write buffer for auto-save files, which receive output as it is logged
+AUTO_SAVE_BUFFER_SIZE = 1 << 16
+
 class HabermasMachine:
     def __init__(self, root):
         self.root = root
@@ -113,11 +193,30 @@ class HabermasMachine:
 
         # State management
         self.stop_event = Event()
-        self.current_response = None
+        self.active_responses = set()  # Streaming Ollama responses, closed on stop
+        self.responses_lock = Lock()
+        # One pooled session so every request reuses a kept-alive connection
+        self.http_session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=2,  # Generation and ranking endpoints
+            pool_maxsize=MAX_CONCURRENT_REQUESTS * 2,
+            max_retries=Retry(total=0)
+        )
+        self.http_session.mount("http://", adapter)
+        self.http_session.mount("https://", adapter)
+        # Long-lived worker pool for candidate and ranking requests
+        self.request_executor = ThreadPoolExecutor(
+            max_workers=MAX_CONCURRENT_REQUESTS,
+            thread_name_prefix="ollama"
+        )
+        self.pending_requests = set()  # Futures from submit_request, cancelled on close
+        self.pending_requests_lock = Lock()
         self.participant_statements = []
         self.candidate_statements = []
         self.election_results = {}
         self.session_id = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.ranking_cache = OrderedDict()  # LRU of predicted rankings, see _ranking_cache_key
+        self.ranking_cache_lock = Lock()
 
         # Model management (new)
         self.model_manager = None
@@ -195,6 +294,20 @@ The ranking array must contain integers 1 through {num_candidates}, ordered from
         
         # Create templates that will be edited
         self.prompt_templates = self.default_templates.copy()
+        self.template_renderers = {}  # Template text -> compile_template() result
+        # Output written by worker threads, drained into the widgets by flush_output
+        self.friendly_log = io.StringIO()  # Complete text, the textboxes may be trimmed
+        self.detailed_log = io.StringIO()
+        self.auto_save_files = {}  # "friendly"/"detailed" -> file receiving that output
+        self.friendly_buffer = deque()
+        self.detailed_buffer = deque()
+        self.pending_debug_prompt = None
+        self.pending_debug_response = None
+        self.flush_lock = Lock()
+        self.flush_scheduled = False
+        self.count_job = None  # Pending debounced participant recount
+        self.participant_split_cache = (None, ())  # (textbox text, statements parsed from it)
+        self.keep_warm_job = None  # Pending model warm-up ping while a run is active
         
         # Create main layout
         self.create_layout()
@@ -446,7 +559,7 @@ The ranking array must contain integers 1 through {num_candidates}, ordered from
         self.participants_text.grid(row=1, column=0, sticky="nsew", padx=0, pady=(0, 5))
         
         # Add text changed callback to update participant count
-        self.participants_text.bind("<KeyRelease>", self.update_participant_count)
+        self.participants_text.bind("<KeyRelease>", self.schedule_participant_count)
         
         # Buttons section - fixed height
         self.buttons_frame = ctk.CTkFrame(inputs_tab)
@@ -515,7 +628,7 @@ The ranking array must contain integers 1 through {num_candidates}, ordered from
             preset_menu = ctk.CTkOptionMenu(
                 preset_frame,
                 variable=self.preset_var,
-                values=["prompted_deepseek", "prompted_llama", "prompted_qwen", "custom"],
+                values=["prompted_deepseek", "prompted_deepseek_fast_rank", "prompted_llama", "prompted_qwen", "custom"],
                 command=self.on_preset_changed,
                 width=200,
                 font=("Arial", 12)
@@ -942,17 +1055,32 @@ The ranking array must contain integers 1 through {num_candidates}, ordered from
         self.response_text = ctk.CTkTextbox(response_frame, wrap="word", font=("Arial", 12))
         self.response_text.grid(row=1, column=0, padx=10, pady=10, sticky="nsew")
     
+    def schedule_participant_count(self, event=None):
+        """Recount participants once typing pauses, rather than on every keystroke"""
+        if self.count_job is not None:
+            self.root.after_cancel(self.count_job)
+        self.count_job = self.root.after(PARTICIPANT_COUNT_DELAY, self.update_participant_count)
+    
     def update_participant_count(self, event=None):
         """Update the participant count label based on the number of non-empty lines"""
+        self.count_job = None
         text = self.participants_text.get("1.0", "end-1c")
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
-        self.participant_count_label.configure(text=f"Count: {len(lines)}")
+        count = len(self.split_participant_text(text))
+        self.participant_count_label.configure(text=f"Count: {count}")
     
     def save_templates(self):
         # Get the current template text
         candidate_template = self.candidate_template_text.get("1.0", "end-1c")
         ranking_template = self.ranking_template_text.get("1.0", "end-1c")
         
+        # Reject templates that could never be filled in
+        for name, template in (("Candidate", candidate_template), ("Ranking", ranking_template)):
+            try:
+                compile_template(template)
+            except ValueError as e:
+                messagebox.showerror("Invalid Template", f"{name} template is malformed: {str(e)}")
+                return
+        
         # Update the templates
         self.prompt_templates["candidate_generation"] = candidate_template
         self.prompt_templates["ranking_prediction"] = ranking_template
@@ -988,11 +1116,11 @@ The ranking array must contain integers 1 through {num_candidates}, ordered from
             return  # User canceled
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                lines = file.readlines()
+            with open(file_path, 'r', encoding='utf-8', errors='replace') as file:
+                text = file.read()
             
-            # Filter out empty lines
-            non_empty_lines = [line.strip() for line in lines if line.strip()]
+            # Filter out empty lines, stripping each line only once
+            non_empty_lines = [stripped for line in text.splitlines() if (stripped := line.strip())]
             
             if not non_empty_lines:
                 messagebox.showerror("Error", "File contains no content.")
@@ -1034,7 +1162,22 @@ The ranking array must contain integers 1 through {num_candidates}, ordered from
     def get_participant_statements(self):
         """Extract participant statements from the textbox"""
         text = self.participants_text.get("1.0", "end-1c")
-        statements = [line.strip() for line in text.split('\n') if line.strip()]
+        return list(self.split_participant_text(text))
+
+    def split_participant_text(self, text):
+        """
+        Split participant text into stripped, non-empty statements.
+
+        The last result is kept, so the count shown while typing and the
+        statements read at generation start share one parse of unchanged text.
+
+        Returns:
+            Tuple of statements
+        """
+        cached_text, statements = self.participant_split_cache
+        if text != cached_text:
+            statements = tuple(stripped for line in text.split('\n') if (stripped := line.strip()))
+            self.participant_split_cache = (text, statements)
         return statements
     
     def save_output(self, output_type):
@@ -1046,11 +1189,11 @@ The ranking array must contain integers 1 through {num_candidates}, ordered from
         if output_type == "friendly":
             filetypes = [("Text files", "*.txt"), ("Markdown files", "*.md"), ("All files", "*.*")]
             initial_filename = f"habermas_results_{self.session_id}.md"
-            content = self.friendly_output.get("1.0", "end-1c")
+            content = self.get_output_text("friendly")
         else:  # detailed
             filetypes = [("Markdown files", "*.md"), ("Text files", "*.txt"), ("All files", "*.*")]
             initial_filename = f"habermas_detailed_{self.session_id}.md"
-            content = self.detailed_output.get("1.0", "end-1c")
+            content = self.get_output_text("detailed")
 
         # Ask user where to save (suggest output directory)
         file_path = ctk.filedialog.asksaveasfilename(
@@ -1084,8 +1227,7 @@ The ranking array must contain integers 1 through {num_candidates}, ordered from
             return
         
         # Clear previous outputs
-        self.friendly_output.delete("1.0", "end")
-        self.detailed_output.delete("1.0", "end")
+        self.clear_outputs()
         
         # Set status
         self.friendly_status_var.set("Generating...")
@@ -1098,12 +1240,20 @@ The ranking array must contain integers 1 through {num_candidates}, ordered from
         self.generate_btn.configure(state="disabled")
         self.recursive_generate_btn.configure(state="disabled")
         
+        # Load both models up front and keep them loaded until the run ends
+        self.start_keeping_models_warm()
+        
         # Start generation thread
         Thread(target=self.run_single_consensus, daemon=True).start()
     
     def run_single_consensus(self):
         """Run a single consensus generation process"""
         try:
+            # Auto save if enabled, writing output to disk as it is logged
+            if self.save_output_var.get():
+                self.open_auto_save(f"habermas_results_{self.session_id}.md",
+                                    f"habermas_detailed_{self.session_id}.md")
+            
             question = self.question_text.get("1.0", "end-1c").strip()
             
             # Initial log entries
@@ -1166,32 +1316,14 @@ The ranking array must contain integers 1 through {num_candidates}, ordered from
             winning_statement = self.candidate_statements[winner_idx]
             
             # Display the winning statement at the top for visibility
-            self.root.after(0, lambda: self.update_friendly_output_with_winner(winning_statement))
+            self.update_friendly_output_with_winner(winning_statement)
             
             # Log the election results
             self.log_election_results(winner_idx, rankings, pairwise_matrix, strongest_paths)
             
-            # Auto save if enabled
-            if self.save_output_var.get():
-                try:
-                    # Create output directory if it doesn't exist
-                    os.makedirs("output", exist_ok=True)
-
-                    # Save friendly output
-                    friendly_path = os.path.join("output", f"habermas_results_{self.session_id}.md")
-                    with open(friendly_path, 'w', encoding='utf-8') as file:
-                        file.write(self.friendly_output.get("1.0", "end-1c"))
-
-                    # Save detailed output
-                    detailed_path = os.path.join("output", f"habermas_detailed_{self.session_id}.md")
-                    with open(detailed_path, 'w', encoding='utf-8') as file:
-                        file.write(self.detailed_output.get("1.0", "end-1c"))
-
-                    self.log_to_friendly(f"\n\n*Results automatically saved to {friendly_path}*\n")
-                    self.log_to_detailed(f"\n\n*Detailed record automatically saved to {detailed_path}*\n")
-                except Exception as e:
-                    self.log_to_friendly(f"\n\n*Failed to auto-save results: {str(e)}*\n")
-                    logger.error(f"Auto-save error: {str(e)}")
+            # Auto save if enabled (the output has been streaming to disk all along)
+            if self.auto_save_files:
+                self.finish_auto_save()
             
             # Set status to complete
             self.root.after(0, lambda: self.friendly_status_var.set("Complete"))
@@ -1216,45 +1348,94 @@ The ranking array must contain integers 1 through {num_candidates}, ordered from
         
         self.log_to_detailed(f"Generating {num_candidates} candidate statements\n\n")
         
+        candidates = self.generate_candidates_concurrently(question, self.participant_statements, num_candidates)
+        
+        for i in range(len(candidates)):
+            self.log_to_friendly(f"Candidate {i+1} generated...\n")
+        
+        return candidates
+    
+    def generate_candidates_concurrently(self, question, statements, num_candidates):
+        """
+        Generate candidate statements in parallel, each from its own shuffle.
+
+        All requests are in flight together so the server can batch them.
+        Each result is logged as soon as it arrives, as one contiguous block.
+        Candidates that duplicate an earlier one (ignoring case and
+        whitespace) are dropped and re-sampled once.
+
+        Returns:
+            List of distinct candidate statements
+        """
         candidates = []
-        for i in range(num_candidates):
-            if self.stop_event.is_set():
+        seen = set()
+        submitted = 0
+        
+        for attempt in range(2):  # First batch, then one re-sample for duplicates
+            needed = num_candidates - len(candidates)
+            if needed <= 0 or self.stop_event.is_set():
                 break
-                
-            # Randomize the order of participant statements for each candidate
-            shuffled_statements = self.participant_statements.copy()
-            random.shuffle(shuffled_statements)
-            
-            self.log_to_detailed(f"### Generating Candidate {i+1}\n\n")
             
-            # Generate the candidate statement
-            candidate = self.generate_single_candidate(question, shuffled_statements, i+1)
-            
-            if candidate and not self.stop_event.is_set():
+            futures = {}
+            for _ in range(needed):
+                # Randomize the order of participant statements for each candidate
+                shuffled_statements = statements.copy()
+                random.shuffle(shuffled_statements)
+                submitted += 1
+                future = self.submit_request(
+                    self.generate_single_candidate, question, shuffled_statements
+                )
+                futures[future] = submitted
+            
+            results = {}
+            for future in as_completed(futures):
+                candidate_num = futures[future]
+                results[candidate_num] = self.log_candidate_result(candidate_num, *future.result())
+            
+            # Keep submission order so the candidate list doesn't depend on timing
+            duplicates = 0
+            for candidate_num in sorted(results):
+                candidate = results[candidate_num]
+                if not candidate or self.stop_event.is_set():
+                    continue
+                key = " ".join(candidate.split()).lower()
+                if key in seen:
+                    duplicates += 1
+                    continue
+                seen.add(key)
                 candidates.append(candidate)
-                self.log_to_friendly(f"Candidate {i+1} generated...\n")
+            
+            if not duplicates:
+                break
+            if attempt == 0:
+                self.log_to_detailed(f"Re-sampling {duplicates} duplicate candidate(s)\n\n")
         
         return candidates
     
-    def generate_single_candidate(self, question, statements, candidate_num):
-        """Generate a single candidate statement"""
+    def generate_single_candidate(self, question, statements):
+        """
+        Request one candidate statement from the generation model.
+
+        Runs on a worker thread and writes nothing to the output logs (only the
+        live debug view), so concurrent candidates can't interleave their
+        records; the caller logs the result with log_candidate_result.
+
+        Returns:
+            Tuple of (prompt, raw_response, error, error_details); raw_response
+            is None and error describes the failure if the request failed
+        """
         # Prepare participant statements text
-        participant_statements_text = ""
-        for i, statement in enumerate(statements):
-            participant_statements_text += f"- {statement}\n\n"
+        participant_statements_text = "".join(f"- {statement}\n\n" for statement in statements)
         
-        # Get the template and format it
-        template = self.prompt_templates["candidate_generation"]
-        prompt = template.format(
+        # Fill in the template
+        prompt = self.render_template(
+            "candidate_generation",
             question=question,
             participant_statements=participant_statements_text
         )
         
-        # Log the prompt to detailed output
-        self.log_to_detailed(f"**Prompt for Candidate {candidate_num}:**\n\n```\n{prompt}\n```\n\n")
-        
         # Update the debug prompt display
-        self.root.after(0, lambda: self.update_debug_prompt(prompt))
+        self.queue_debug_prompt(prompt)
         
         # Prepare API call parameters - use generation-specific settings
         model = self.gen_model_var.get()
@@ -1269,76 +1450,102 @@ The ranking array must contain integers 1 through {num_candidates}, ordered from
             top_k = 40
 
         # Make the API call
+        response = None
         try:
-            self.current_response = requests.post(
+            response = self.http_session.post(
                 api_endpoint,
                 json={
                     "model": model,
                     "prompt": prompt,
                     "stream": True,
+                    "keep_alive": OLLAMA_KEEP_ALIVE,
                     "options": {
                         "temperature": temperature,
                         "top_p": top_p,
                         "top_k": top_k
                     }
                 },
-                stream=True
+                stream=True,
+                timeout=OLLAMA_TIMEOUT
             )
+            with self.responses_lock:
+                self.active_responses.add(response)
             
-            if self.current_response.status_code != 200:
+            if response.status_code != 200:
                 try:
-                    error_detail = self.current_response.text
+                    error_detail = response.text
                 except:
                     error_detail = "Unable to read error details"
-                error_msg = f"API Error: Status code {self.current_response.status_code}\n{error_detail}"
-                self.log_to_friendly(f"**Error generating candidate {candidate_num}:** {error_msg}\n\n")
-                self.log_to_detailed(f"**Error:** {error_msg}\n\n")
-                logger.error(error_msg)
-                return None
+                return prompt, None, f"API Error: Status code {response.status_code}\n{error_detail}", None
             
-            full_response = ""
-            for line in self.current_response.iter_lines():
+            chunks = []  # Joined once at the end instead of copying per token
+            decode_errors = []
+            for line in response.iter_lines():
                 if self.stop_event.is_set():
                     break
                     
                 if line:
                     try:
-                        data = json.loads(line)
-                        if 'response' in data:
+                        response_text, _ = extract_response_token(line)
+                        if response_text is not None:
                             # Handle streamed text
-                            response_text = data['response']
-                            full_response += response_text
+                            chunks.append(response_text)
                             
                             # Update the debug response display
-                            self.root.after(0, lambda r=full_response: self.update_debug_response(r))
+                            self.queue_debug_response(chunks)
                     except json.JSONDecodeError as e:
-                        error_msg = f"Failed to decode response from Ollama API: {str(e)}"
-                        self.log_to_friendly(f"**Error:** {error_msg}\n\n")
-                        self.log_to_detailed(f"**Error:** {error_msg}\n\n")
-                
-            # Log the response
-            self.log_to_detailed(f"**Raw Response for Candidate {candidate_num}:**\n\n```\n{full_response}\n```\n\n")
+                        decode_errors.append(f"Failed to decode response from Ollama API: {str(e)}")
+            
+            return prompt, "".join(chunks), "\n".join(decode_errors) or None, None
+            
+        except Exception as e:
+            return prompt, None, str(e), traceback.format_exc()
+        finally:
+            if response is not None:
+                with self.responses_lock:
+                    self.active_responses.discard(response)
+    
+    def log_candidate_result(self, candidate_num, prompt, full_response, error, error_details):
+        """
+        Log one generate_single_candidate result and extract its statement.
 
-            # Remove the <think>...</think> tag that DeepSeek-R1 may add
-            clean_response = re.sub(r'<think>.*?</think>', '', full_response, flags=re.DOTALL).strip()
+        Returns:
+            The candidate statement, or None if generation failed
+        """
+        self.log_to_detailed(f"**Prompt for Candidate {candidate_num}:**\n\n```\n{prompt}\n```\n\n")
+        
+        if full_response is None:
+            if error_details is None:
+                # The server answered with an error status
+                self.log_to_friendly(f"**Error generating candidate {candidate_num}:** {error}\n\n")
+                self.log_to_detailed(f"**Error:** {error}\n\n")
+                logger.error(error)
+            else:
+                error_msg = f"Error generating candidate {candidate_num}: {error}"
+                self.log_to_friendly(f"**Error:** {error_msg}\n\n")
+                self.log_to_detailed(f"**Error:** {error_msg}\n\nStacktrace:\n```\n{error_details}\n```\n\n")
+                logger.error(f"{error_msg}\n{error_details}")
+            return None
+        
+        if error:
+            # Undecodable stream lines; whatever did decode is still used
+            self.log_to_friendly(f"**Error:** {error}\n\n")
+            self.log_to_detailed(f"**Error:** {error}\n\n")
+        
+        # Log the response
+        self.log_to_detailed(f"**Raw Response for Candidate {candidate_num}:**\n\n```\n{full_response}\n```\n\n")
 
-            # Extract the statement from structured response (if using ---STATEMENT--- format)
-            # This handles models that include reasoning or chitchat
-            extracted_statement = self.extract_statement_from_response(clean_response)
+        # Remove the <think>...</think> tag that DeepSeek-R1 may add
+        clean_response = clean_deepseek_response(full_response)
 
-            if extracted_statement != clean_response:
-                self.log_to_detailed(f"**Extracted Statement (after removing reasoning):**\n\n```\n{extracted_statement}\n```\n\n")
+        # Extract the statement from structured response (if using ---STATEMENT--- format)
+        # This handles models that include reasoning or chitchat
+        extracted_statement = self.extract_statement_from_response(clean_response)
 
-            return extracted_statement
-            
-        except Exception as e:
-            error_msg = f"Error generating candidate {candidate_num}: {str(e)}"
-            self.log_to_friendly(f"**Error:** {error_msg}\n\n")
-            self.log_to_detailed(f"**Error:** {error_msg}\n\nStacktrace:\n```\n{traceback.format_exc()}\n```\n\n")
-            logger.error(error_msg, exc_info=True)
-            return None
-        finally:
-            self.current_response = None
+        if extracted_statement != clean_response:
+            self.log_to_detailed(f"**Extracted Statement (after removing reasoning):**\n\n```\n{extracted_statement}\n```\n\n")
+
+        return extracted_statement
     
     def run_election_simulation(self, question):
         """Simulate an election between candidate statements"""
@@ -1352,30 +1559,22 @@ The ranking array must contain integers 1 through {num_candidates}, ordered from
         
         self.log_to_detailed("### Predicting Participant Rankings\n\n")
         
-        # For each participant, predict their rankings
-        for p_idx in range(num_participants):
-            if self.stop_event.is_set():
-                return None, None, None, None
-                
-            participant_statement = self.participant_statements[p_idx]
-            
-            self.log_to_detailed(f"**Predicting ranking for Participant {p_idx+1}**\n\n")
-            
-            # Predict ranking for this participant with JSON format
-            predicted_ranking, attempts_log = self.predict_participant_ranking_json(
-                question, 
-                participant_statement, 
-                self.candidate_statements,
-                p_idx + 1
-            )
-            
+        # Predict every participant's ranking concurrently
+        voters = [
+            (statement, p_idx + 1, f"Participant {p_idx + 1}")
+            for p_idx, statement in enumerate(self.participant_statements)
+        ]
+        predictions = self.predict_rankings_concurrently(
+            question,
+            voters,
+            self.candidate_statements
+        )
+        
+        for p_idx, (predicted_ranking, attempts_log) in enumerate(predictions):
             ranking_attempts_log.append(attempts_log)
             
             if predicted_ranking:
                 rankings[p_idx] = predicted_ranking
-                
-                # Log the predicted ranking
-                self.log_to_detailed(f"**Predicted ranking:** {[r+1 for r in predicted_ranking]}\n\n")
         
         if self.stop_event.is_set():
             return None, None, None, None
@@ -1390,38 +1589,50 @@ The ranking array must contain integers 1 through {num_candidates}, ordered from
         
         return winner_idx, rankings, pairwise_matrix, strongest_paths
     
-    def predict_participant_ranking_json(self, question, participant_statement, candidate_statements, participant_num):
-        """Predict a participant's ranking with JSON format output and retries"""
+    def predict_participant_ranking_json(self, question, participant_statement, candidate_statements, participant_num,
+                                         system_prompt=None, candidate_block=None):
+        """
+        Predict a participant's ranking with JSON format output and retries.
+
+        Runs on a worker thread, so instead of writing to the output logs it
+        returns its records for the caller to write as one block.
+
+        Returns:
+            Tuple of (ranking, attempts_log, log_records), where log_records is a
+            list of ("friendly" | "detailed", text) pairs
+        """
+        log_records = []
         # Get max retries from settings
         try:
             max_retries = int(self.max_retries_var.get())
         except ValueError:
             max_retries = 3
         
-        # Create a system prompt for JSON output
-        system_prompt = self.create_ranking_system_prompt(len(candidate_statements))
+        # Create a system prompt for JSON output unless the caller supplies one.
+        # Built per voter so the random example ranking doesn't bias every voter alike
+        if system_prompt is None:
+            system_prompt = self.create_ranking_system_prompt(len(candidate_statements))
         
-        # Prepare candidate statements text
-        candidate_statements_text = "\n\n---\n\n"
-        for i, statement in enumerate(candidate_statements):
-            candidate_statements_text += f"```\nSTATEMENT {i+1}:\n{statement}\n```\n\n"
+        # Prepare candidate statements text unless the caller rendered it already
+        if candidate_block is None:
+            candidate_block = self.format_candidate_block(candidate_statements)
         
-        # Get the template and format it
-        template = self.prompt_templates["ranking_prediction"] 
-        prompt = template.format(
+        # Fill in the template
+        prompt = self.render_template(
+            "ranking_prediction",
             question=question,
             participant_num=participant_num,
             participant_statement=participant_statement,
             num_candidates=len(candidate_statements),
-            candidate_statements=candidate_statements_text
+            candidate_statements=candidate_block
         )
         
         # Log the prompt to detailed output
-        self.log_to_detailed(f"**SYSTEM PROMPT:**\n\n```\n{system_prompt}\n```\n\n")
-        self.log_to_detailed(f"**USER PROMPT:**\n\n```\n{prompt}\n```\n\n")
+        log_records.append(("detailed", f"**SYSTEM PROMPT:**\n\n```\n{system_prompt}\n```\n\n"))
+        log_records.append(("detailed", f"**USER PROMPT:**\n\n```\n{prompt}\n```\n\n"))
         
         # Update the debug prompt display
-        self.root.after(0, lambda: self.update_debug_prompt(f"System prompt:\n{system_prompt}\n\n---\n\nUser prompt:\n{prompt}"))
+        self.queue_debug_prompt(f"System prompt:\n{system_prompt}\n\n---\n\nUser prompt:\n{prompt}")
         
         # Prepare API call parameters - use ranking-specific settings
         model = self.rank_model_var.get()
@@ -1431,71 +1642,105 @@ The ranking array must contain integers 1 through {num_candidates}, ordered from
         except ValueError:
             temperature = 0.2  # Lower temperature for more deterministic ranking prediction
 
+        # Identical ranking requests recur across re-runs and recursive levels
+        cache_key = self._ranking_cache_key(
+            model, api_endpoint, temperature, question, participant_statement, candidate_statements
+        )
+        cached_ranking = self._ranking_cache_get(cache_key, candidate_statements)
+        if cached_ranking is not None:
+            log_records.append(("detailed", f"**Ranking reused from cache:** {[r+1 for r in cached_ranking]}\n\n"))
+            return cached_ranking, ["Cache hit: reused ranking from an identical earlier request."], log_records
+
         # Keep track of retry attempts
         attempts = 0
         attempts_log = []
+        repair_response = None  # Last unparseable reply, if any
+        repair_retries = 0
 
         while attempts < max_retries:
+            if self.stop_event.is_set():
+                return None, attempts_log, log_records
             attempts += 1
+            response = None
+
+            # A reply that merely failed to parse is cheaper to repair: same prompt
+            # prefix (already cached by the server), greedy decoding, short answer
+            if repair_response is not None and repair_retries < MAX_JSON_REPAIR_RETRIES:
+                repair_retries += 1
+                request_prompt = prompt + JSON_REPAIR_SUFFIX.format(previous=repair_response)
+                options = {"temperature": 0, "top_p": 1, "top_k": 1}
+                attempts_log.append(f"Attempt {attempts}: Asking for JSON only at temperature 0")
+            else:
+                request_prompt = prompt
+                options = {"temperature": temperature}
+            repair_response = None
 
             # Make the API call with system prompt
             try:
-                self.current_response = requests.post(
+                response = self.http_session.post(
                     api_endpoint,
                     json={
                         "model": model,
-                        "prompt": prompt,
+                        "prompt": request_prompt,
                         "system": system_prompt,  # Add system prompt here
                         "stream": True,
-                        "options": {
-                            "temperature": temperature
-                        }
+                        "keep_alive": OLLAMA_KEEP_ALIVE,
+                        "options": options
                     },
-                    stream=True
+                    stream=True,
+                    timeout=OLLAMA_TIMEOUT
                 )
+                with self.responses_lock:
+                    self.active_responses.add(response)
                 
-                if self.current_response.status_code != 200:
+                if response.status_code != 200:
                     try:
-                        error_detail = self.current_response.text
+                        error_detail = response.text
                     except:
                         error_detail = "Unable to read error details"
-                    attempt_error = f"Attempt {attempts}: API Error: Status code {self.current_response.status_code}\n{error_detail}"
+                    attempt_error = f"Attempt {attempts}: API Error: Status code {response.status_code}\n{error_detail}"
                     attempts_log.append(attempt_error)
-                    self.log_to_friendly(f"**Ranking prediction error for Participant {participant_num}:** {attempt_error}\n\n")
-                    self.log_to_detailed(f"**{attempt_error}**\n\n")
+                    log_records.append(("friendly", f"**Ranking prediction error for Participant {participant_num}:** {attempt_error}\n\n"))
+                    log_records.append(("detailed", f"**{attempt_error}**\n\n"))
                     continue
                 
-                full_response = ""
-                for line in self.current_response.iter_lines():
+                chunks = []  # Joined once at the end instead of copying per token
+                for line in response.iter_lines():
                     if self.stop_event.is_set():
                         break
                         
                     if line:
                         try:
-                            data = json.loads(line)
-                            if 'response' in data:
-                                response_text = data['response']
-                                full_response += response_text
+                            response_text, _ = extract_response_token(line)
+                            if response_text is not None:
+                                chunks.append(response_text)
                                 
                                 # Update the debug response display
-                                self.root.after(0, lambda r=full_response: self.update_debug_response(r))
+                                self.queue_debug_response(chunks)
+                                
+                                # Stop reading once the ranking object has closed
+                                if '}' in response_text and self.ranking_json_complete("".join(chunks)):
+                                    response.close()
+                                    break
                         except json.JSONDecodeError:
                             pass
+                full_response = "".join(chunks)
                 
                 # Log this attempt
                 attempts_log.append(f"Attempt {attempts}: Response received, parsing...")
-                self.log_to_detailed(f"**Attempt {attempts} response:**\n\n```\n{full_response}\n```\n\n")
+                log_records.append(("detailed", f"**Attempt {attempts} response:**\n\n```\n{full_response}\n```\n\n"))
                 
                 # Try to extract JSON from the response
                 try:
                     # Remove the <think>...</think> tag that DeepSeek-R1 may add
-                    clean_response = re.sub(r'<think>.*?</think>', '', full_response, flags=re.DOTALL).strip()
+                    clean_response = clean_deepseek_response(full_response)
+                    repair_response = clean_response or None
                     
-                    # Try to find a JSON object within the text
-                    match = re.search(r'({[\s\S]*?})', clean_response)
+                    # Prefer a ranking-shaped object, otherwise try the first JSON object
+                    match = RANKING_OBJECT_RE.search(clean_response) or FIRST_OBJECT_RE.search(clean_response)
                     if match:
-                        json_str = match.group(1)
-                        ranking_data = json.loads(json_str)
+                        json_str = match.group(0)
+                        ranking_data = _json_loads(json_str)
                         
                         if "ranking" in ranking_data and isinstance(ranking_data["ranking"], list):
                             # Convert 1-indexed to 0-indexed
@@ -1505,41 +1750,169 @@ The ranking array must contain integers 1 through {num_candidates}, ordered from
                             valid_indices = set(range(len(candidate_statements)))
                             if set(ranking) == valid_indices and len(ranking) == len(candidate_statements):
                                 attempts_log.append(f"Attempt {attempts}: Success! Valid JSON ranking found.")
-                                self.log_to_detailed(f"**Ranking parsed successfully:** {[r+1 for r in ranking]}\n\n")
-                                return ranking, attempts_log
+                                log_records.append(("detailed", f"**Ranking parsed successfully:** {[r+1 for r in ranking]}\n\n"))
+                                self._ranking_cache_put(cache_key, candidate_statements, ranking)
+                                return ranking, attempts_log, log_records
                             else:
                                 attempts_log.append(f"Attempt {attempts}: Invalid ranking indices: {ranking}")
-                                self.log_to_detailed(f"**Invalid ranking indices:** {ranking}\n\n")
+                                log_records.append(("detailed", f"**Invalid ranking indices:** {ranking}\n\n"))
                         else:
                             attempts_log.append(f"Attempt {attempts}: JSON missing 'ranking' field or not a list")
-                            self.log_to_detailed("**JSON missing 'ranking' field or not a list**\n\n")
+                            log_records.append(("detailed", "**JSON missing 'ranking' field or not a list**\n\n"))
                     else:
                         attempts_log.append(f"Attempt {attempts}: No JSON object found in response")
-                        self.log_to_detailed("**No JSON object found in response**\n\n")
+                        log_records.append(("detailed", "**No JSON object found in response**\n\n"))
                 
                 except json.JSONDecodeError as e:
                     attempts_log.append(f"Attempt {attempts}: JSON parsing error: {str(e)}")
-                    self.log_to_detailed(f"**JSON parsing error:** {str(e)}\n\n")
+                    log_records.append(("detailed", f"**JSON parsing error:** {str(e)}\n\n"))
                 except Exception as e:
                     attempts_log.append(f"Attempt {attempts}: Error processing response: {str(e)}")
-                    self.log_to_detailed(f"**Error processing response:** {str(e)}\n\n")
+                    log_records.append(("detailed", f"**Error processing response:** {str(e)}\n\n"))
                 
             except Exception as e:
                 attempts_log.append(f"Attempt {attempts}: Exception: {str(e)}")
-                self.log_to_friendly(f"**Ranking prediction exception for Participant {participant_num}:** {str(e)}\n\n")
-                self.log_to_detailed(f"**Exception:** {str(e)}\n\nStacktrace:\n```\n{traceback.format_exc()}\n```\n\n")
+                log_records.append(("friendly", f"**Ranking prediction exception for Participant {participant_num}:** {str(e)}\n\n"))
+                log_records.append(("detailed", f"**Exception:** {str(e)}\n\nStacktrace:\n```\n{traceback.format_exc()}\n```\n\n"))
             finally:
-                self.current_response = None
+                if response is not None:
+                    with self.responses_lock:
+                        self.active_responses.discard(response)
         
         # If we get here, all attempts failed
         attempts_log.append("All attempts failed. Falling back to random ranking.")
-        self.log_to_friendly(f"**Warning:** Failed to predict ranking for Participant {participant_num} after {max_retries} attempts. Using random ranking as fallback.\n\n")
-        self.log_to_detailed("**All attempts failed. Falling back to random ranking.**\n\n")
+        log_records.append(("friendly", f"**Warning:** Failed to predict ranking for Participant {participant_num} after {max_retries} attempts. Using random ranking as fallback.\n\n"))
+        log_records.append(("detailed", "**All attempts failed. Falling back to random ranking.**\n\n"))
         
         # Fallback to a random ranking
         random_ranking = list(range(len(candidate_statements)))
         random.shuffle(random_ranking)
-        return random_ranking, attempts_log
+        return random_ranking, attempts_log, log_records
+
+    def ranking_json_complete(self, text):
+        """
+        Check whether a partially streamed ranking reply already holds its answer.
+
+        Only text outside <think> blocks counts, so a draft ranking inside
+        unfinished reasoning does not end the stream early.
+        """
+        text = clean_deepseek_response(text)
+        if '<think>' in text:
+            return False
+        return RANKING_OBJECT_RE.search(text) is not None
+
+    def _ranking_cache_key(self, model, api_endpoint, temperature, question, participant_statement, candidate_statements):
+        """
+        Build an order-independent cache key for a ranking prediction.
+
+        Candidates are keyed as a sorted tuple so the same slate presented in a
+        different order still hits. Returns None when candidate texts repeat,
+        because a cached ranking could not be mapped back unambiguously.
+        """
+        if len(set(candidate_statements)) != len(candidate_statements):
+            return None
+        return (
+            model,
+            api_endpoint,
+            temperature,
+            self.prompt_templates["ranking_prediction"],
+            question,
+            participant_statement,
+            tuple(sorted(candidate_statements)),
+        )
+
+    def _ranking_cache_get(self, key, candidate_statements):
+        """Return a cached ranking as indices into candidate_statements, or None"""
+        if key is None:
+            return None
+        with self.ranking_cache_lock:
+            preferred = self.ranking_cache.get(key)
+            if preferred is None:
+                return None
+            self.ranking_cache.move_to_end(key)
+        position = {statement: i for i, statement in enumerate(candidate_statements)}
+        return [position[statement] for statement in preferred]
+
+    def _ranking_cache_put(self, key, candidate_statements, ranking):
+        """Store a ranking by candidate text so it survives candidate re-ordering"""
+        if key is None:
+            return
+        with self.ranking_cache_lock:
+            self.ranking_cache[key] = tuple(candidate_statements[i] for i in ranking)
+            self.ranking_cache.move_to_end(key)
+            while len(self.ranking_cache) > RANKING_CACHE_SIZE:
+                self.ranking_cache.popitem(last=False)
+
+    def render_template(self, template_key, **fields):
+        """Fill a prompt template, parsing each distinct template text only once"""
+        template = self.prompt_templates[template_key]
+        renderer = self.template_renderers.get(template)
+        if renderer is None:
+            renderer = self.template_renderers[template] = compile_template(template)
+        return renderer(**fields)
+
+    def format_candidate_block(self, candidate_statements):
+        """Render the candidate statements section of the ranking prompt"""
+        return "\n\n---\n\n" + "".join(
+            f"```\nSTATEMENT {i+1}:\n{statement}\n```\n\n"
+            for i, statement in enumerate(candidate_statements)
+        )
+
+    def predict_rankings_concurrently(self, question, voters, candidate_statements):
+        """
+        Predict rankings for several voters in parallel.
+
+        Each voter's records are written as one block, in voter order, as soon
+        as that voter and all before it have finished.
+
+        Args:
+            question: The question being debated
+            voters: List of (participant_statement, participant_num, label) tuples,
+                where label names the voter in the log
+            candidate_statements: Candidate statements to rank
+
+        Returns:
+            List of (ranking, attempts_log) tuples in the same order as voters
+        """
+        if not voters:
+            return []
+        
+        # The system prompt and candidate block are identical for every voter,
+        # so render them once; the shared system prompt also keeps the leading
+        # bytes of the requests identical for Ollama's prompt cache
+        system_prompt = self.create_ranking_system_prompt(len(candidate_statements))
+        candidate_block = self.format_candidate_block(candidate_statements)
+        
+        futures = [
+            self.submit_request(
+                self.predict_participant_ranking_json,
+                question,
+                statement,
+                candidate_statements,
+                participant_num,
+                system_prompt,
+                candidate_block
+            )
+            for statement, participant_num, _ in voters
+        ]
+        
+        results = []
+        for future, (_, _, label) in zip(futures, voters):
+            ranking, attempts_log, log_records = future.result()
+            self.log_to_detailed(f"**Predicting ranking for {label}**\n\n")
+            self.write_log_records(log_records)
+            if ranking:
+                self.log_to_detailed(f"**Predicted ranking:** {[r+1 for r in ranking]}\n\n")
+            results.append((ranking, attempts_log))
+        return results
+
+    def write_log_records(self, log_records):
+        """Write ("friendly" | "detailed", text) records collected by a worker thread"""
+        for target, text in log_records:
+            if target == "friendly":
+                self.log_to_friendly(text)
+            else:
+                self.log_to_detailed(text)
 
     def extract_statement_from_response(self, response):
         """
@@ -1549,16 +1922,16 @@ The ranking array must contain integers 1 through {num_candidates}, ordered from
         falls back to using the entire response.
         """
         # Try to find ---STATEMENT--- section
-        match = re.search(r'---STATEMENT---\s*(.+)', response, re.DOTALL | re.IGNORECASE)
+        match = STATEMENT_SECTION_RE.search(response)
 
         if match:
             statement = match.group(1).strip()
             # Remove any trailing markers or artifacts
-            statement = re.sub(r'\s*---\w+---.*$', '', statement, flags=re.DOTALL)
+            statement = TRAILING_MARKER_RE.sub('', statement)
             return statement
 
         # Fallback: use entire response, but try to clean obvious reasoning sections
-        cleaned = re.sub(r'^---REASONING---.*?(?=---STATEMENT---|$)', '', response, flags=re.DOTALL | re.IGNORECASE)
+        cleaned = LEADING_REASONING_RE.sub('', response)
         return cleaned.strip()
 
     def extract_ranking_from_response(self, response):
@@ -1597,19 +1970,20 @@ The ranking array must contain integers 1 through {num_candidates}, ordered from
 
     def create_ranking_system_prompt(self, num_candidates):
         """Create a system prompt that instructs the model to output JSON ranking"""
-        # Generate a simple non-biasing example with a different number of candidates
-        example_size = max(3, num_candidates - 1)  # Use a different number to avoid bias
-        example_ranking = list(range(1, example_size + 1))
-        random.shuffle(example_ranking)  # Randomize to avoid bias
+        # The example uses placeholder letters with a different number of
+        # candidates, so it suggests no particular order. That keeps the prompt
+        # identical for every voter without biasing them all the same way
+        example_size = max(3, num_candidates - 1)
+        example_ranking = ", ".join(string.ascii_uppercase[:example_size])
         
         system_prompt = (
             "You are a ranking prediction assistant that outputs results in JSON format. "
             "Your task is to predict how a participant would rank statements based on their perspective.\n\n"
             f"Your response MUST be a valid JSON object with a 'ranking' field containing an array of integers representing "
             f"statement numbers (1 to {num_candidates}), ordered from most preferred to least preferred.\n\n"
-            "Example JSON format (do not copy these example values):\n"
+            "Example JSON format (each letter stands for a statement number):\n"
             "{\n"
-            f"  \"ranking\": {example_ranking}\n"
+            f"  \"ranking\": [{example_ranking}]\n"
             "}\n\n"
             "Your entire response should ONLY contain the JSON object, with no additional text before or after."
         )
@@ -1629,52 +2003,38 @@ The ranking array must contain integers 1 through {num_candidates}, ordered from
             pairwise_matrix: Matrix of pairwise preferences
             strongest_paths: Matrix of strongest path strengths
         """
-        # Step 1: Initialize the pairwise preference matrix
-        pairwise_matrix = [[0 for _ in range(num_candidates)] for _ in range(num_candidates)]
-        
-        # Step 2: For each voter, count pairwise preferences
-        for p_idx, ranking in rankings.items():
-            # For each pair of candidates in the voter's ranking
-            for i in range(len(ranking)):
-                for j in range(i + 1, len(ranking)):
-                    # The candidate at ranking[i] is preferred over the candidate at ranking[j]
-                    preferred = ranking[i]
-                    not_preferred = ranking[j]
-                    pairwise_matrix[preferred][not_preferred] += 1
-        
-        # Step 3: Find the strongest paths (Floyd-Warshall algorithm)
-        strongest_paths = [[0 for _ in range(num_candidates)] for _ in range(num_candidates)]
-        
-        # Initialize with direct pairwise preferences
-        for i in range(num_candidates):
-            for j in range(num_candidates):
-                if i != j:
-                    strongest_paths[i][j] = pairwise_matrix[i][j]
-        
-        # Calculate strongest paths
+        # Step 1: Each voter's position for every candidate (unranked candidates
+        # get position num_candidates, after all ranked ones)
+        positions = np.full((len(rankings), num_candidates), num_candidates, dtype=np.int16)
+        for row, ranking in enumerate(rankings.values()):
+            positions[row, ranking] = np.arange(len(ranking))
+        ranked = positions < num_candidates
+        
+        # Step 2: Count pairwise preferences for all voters at once. A voter
+        # prefers a over b if both are ranked and a comes first
+        prefers = (positions[:, :, None] < positions[:, None, :]) & ranked[:, None, :]
+        pairwise = prefers.sum(axis=0, dtype=np.int32)
+        
+        # Step 3: Find the strongest paths (Floyd-Warshall algorithm), relaxing
+        # every pair through intermediate candidate i in one step
+        strongest = pairwise.copy()
+        np.fill_diagonal(strongest, 0)
         for i in range(num_candidates):
-            for j in range(num_candidates):
-                if i != j:
-                    for k in range(num_candidates):
-                        if i != k and j != k:
-                            strongest_paths[j][k] = max(
-                                strongest_paths[j][k],
-                                min(strongest_paths[j][i], strongest_paths[i][k])
-                            )
+            np.maximum(strongest, np.minimum(strongest[:, i:i + 1], strongest[i:i + 1, :]), out=strongest)
+        np.fill_diagonal(strongest, 0)
         
         # Step 4: Determine the winner
         # A candidate is a winner if their strongest path to every other candidate is stronger than
         # or equal to the strongest path from each other candidate to them
-        potential_winners = set(range(num_candidates))
-        
-        for i in range(num_candidates):
-            for j in range(num_candidates):
-                if i != j and strongest_paths[j][i] > strongest_paths[i][j]:
-                    if i in potential_winners:
-                        potential_winners.remove(i)
+        beaten = (strongest.T > strongest).any(axis=1)
+        potential_winners = np.flatnonzero(~beaten)
         
         # Return the winner with the lowest index (if there are multiple winners)
-        winner_idx = min(potential_winners) if potential_winners else 0
+        winner_idx = int(potential_winners[0]) if potential_winners.size else 0
+        
+        # Plain nested lists for logging and callers
+        pairwise_matrix = pairwise.tolist()
+        strongest_paths = strongest.tolist()
         
         return winner_idx, pairwise_matrix, strongest_paths
     
@@ -1780,29 +2140,24 @@ The ranking array must contain integers 1 through {num_candidates}, ordered from
         self.log_to_detailed("(Lower number = higher preference)\n\n")
         
         # Create a table-like format for participant rankings
-        rankings_table = "| Participant |"
-        for i in range(len(self.candidate_statements)):
-            rankings_table += f" Stmt {i+1} |"
-        rankings_table += "\n|------------|"
-        rankings_table += "--------|" * len(self.candidate_statements)
-        rankings_table += "\n"
+        num_candidates = len(self.candidate_statements)
+        table_lines = [
+            "| Participant |" + "".join(f" Stmt {i+1} |" for i in range(num_candidates)),
+            "|------------|" + "--------|" * num_candidates,
+        ]
         
         # Add each participant's ranking
         for p_idx in sorted(rankings.keys()):
-            p_ranking = rankings[p_idx]
-            row = f"|     P{p_idx + 1}     |"
-            
-            # Create ranking display
-            for stmt_idx in range(len(self.candidate_statements)):
-                if p_ranking and stmt_idx in p_ranking:
-                    rank = p_ranking.index(stmt_idx) + 1
-                    row += f"   {rank}   |"
-                else:
-                    row += "   -   |"
+            # Invert the preference list into a per-statement rank row in one pass,
+            # instead of searching the list for every statement
+            positions = ["-"] * num_candidates
+            for rank, stmt_idx in enumerate(rankings[p_idx], 1):
+                if 0 <= stmt_idx < num_candidates:
+                    positions[stmt_idx] = rank
             
-            rankings_table += row + "\n"
+            table_lines.append(f"|     P{p_idx + 1}     |" + "".join(f"   {rank}   |" for rank in positions))
         
-        self.log_to_detailed(rankings_table + "\n")
+        self.log_to_detailed("\n".join(table_lines) + "\n\n")
         
         # Add methodology explanation
         self.log_to_detailed("#### Election Methodology\n\n")
@@ -1831,8 +2186,7 @@ The ranking array must contain integers 1 through {num_candidates}, ordered from
             return
         
         # Clear previous outputs
-        self.friendly_output.delete("1.0", "end")
-        self.detailed_output.delete("1.0", "end")
+        self.clear_outputs()
         
         # Set status
         self.friendly_status_var.set("Generating...")
@@ -1845,12 +2199,20 @@ The ranking array must contain integers 1 through {num_candidates}, ordered from
         self.generate_btn.configure(state="disabled")
         self.recursive_generate_btn.configure(state="disabled")
         
+        # Load both models up front and keep them loaded until the run ends
+        self.start_keeping_models_warm()
+        
         # Start generation thread
         Thread(target=self.run_recursive_consensus, daemon=True).start()
     
     def run_recursive_consensus(self):
         """Run the recursive consensus generation process"""
         try:
+            # Auto save if enabled, writing output to disk as it is logged
+            if self.save_output_var.get():
+                self.open_auto_save(f"habermas_recursive_results_{self.session_id}.md",
+                                    f"habermas_recursive_detailed_{self.session_id}.md")
+            
             question = self.question_text.get("1.0", "end-1c").strip()
             
             # Get and validate max group size
@@ -1923,7 +2285,7 @@ The ranking array must contain integers 1 through {num_candidates}, ordered from
                 
             if final_statement:
                 # Display the final result at the top for visibility
-                self.root.after(0, lambda: self.update_friendly_output_with_consensus(final_statement))
+                self.update_friendly_output_with_consensus(final_statement)
                 
                 # Log the final result
                 self.log_to_friendly("\n## Consensus Building Process Complete\n\n")
@@ -1946,27 +2308,9 @@ The ranking array must contain integers 1 through {num_candidates}, ordered from
                 self.log_to_detailed("\n## Process Failed\n\n")
                 self.log_to_detailed("The recursive consensus process was unable to complete successfully.\n\n")
             
-            # Auto save if enabled
-            if self.save_output_var.get():
-                try:
-                    # Create output directory if it doesn't exist
-                    os.makedirs("output", exist_ok=True)
-
-                    # Save friendly output
-                    friendly_path = os.path.join("output", f"habermas_recursive_results_{self.session_id}.md")
-                    with open(friendly_path, 'w', encoding='utf-8') as file:
-                        file.write(self.friendly_output.get("1.0", "end-1c"))
-
-                    # Save detailed output
-                    detailed_path = os.path.join("output", f"habermas_recursive_detailed_{self.session_id}.md")
-                    with open(detailed_path, 'w', encoding='utf-8') as file:
-                        file.write(self.detailed_output.get("1.0", "end-1c"))
-
-                    self.log_to_friendly(f"\n\n*Results automatically saved to {friendly_path}*\n")
-                    self.log_to_detailed(f"\n\n*Detailed record automatically saved to {detailed_path}*\n")
-                except Exception as e:
-                    self.log_to_friendly(f"\n\n*Failed to auto-save results: {str(e)}*\n")
-                    logger.error(f"Auto-save error: {str(e)}")
+            # Auto save if enabled (the output has been streaming to disk all along)
+            if self.auto_save_files:
+                self.finish_auto_save()
             
             # Set status to complete
             self.root.after(0, lambda: self.friendly_status_var.set("Complete"))
@@ -2035,7 +2379,9 @@ The ranking array must contain integers 1 through {num_candidates}, ordered from
             return winning_statement
             
         # Otherwise, divide into groups and process recursively
-        groups = self.divide_statements_into_groups(statements, max_group_size)
+        # (index groups keep track of which statement went where after shuffling)
+        index_groups = self.partition_indices(len(statements), max_group_size)
+        groups = [[statements[i] for i in member_indices] for member_indices in index_groups]
         
         self.log_to_friendly(f"Dividing into {len(groups)} groups...\n\n")
         self.log_to_detailed(f"Dividing into {len(groups)} groups\n\n")
@@ -2044,7 +2390,7 @@ The ranking array must contain integers 1 through {num_candidates}, ordered from
         winning_statements = []
         new_participant_mapping = {}  # Maps winning statement index to original participant indices
         
-        for group_idx, group in enumerate(groups):
+        for group_idx, (group, member_indices) in enumerate(zip(groups, index_groups)):
             if self.stop_event.is_set():
                 return None
             
@@ -2054,17 +2400,12 @@ The ranking array must contain integers 1 through {num_candidates}, ordered from
             
             # Get list of original participant indices for this group
             if level == 0:
-                # At level 0, map the group's statement indices to original participant indices
-                group_participant_indices = []
-                start_idx = sum(len(g) for g in groups[:group_idx])
-                for i in range(len(group)):
-                    group_participant_indices.append(start_idx + i)
+                # At level 0, statement indices are original participant indices
+                group_participant_indices = list(member_indices)
             else:
                 # At higher levels, use the existing mapping to find original participants
                 group_participant_indices = []
-                start_idx = sum(len(g) for g in groups[:group_idx])
-                for i in range(len(group)):
-                    orig_idx = start_idx + i
+                for orig_idx in member_indices:
                     if orig_idx in participant_mapping:
                         group_participant_indices.extend(participant_mapping[orig_idx])
             
@@ -2133,6 +2474,11 @@ The ranking array must contain integers 1 through {num_candidates}, ordered from
         # Log what we're about to do
         self.log_to_detailed(f"**Processing {group_label}**\n\n")
         
+        # A lone statement is already its own consensus
+        if len(statements) == 1:
+            self.log_to_detailed("Single statement in group; carrying it forward unchanged.\n\n")
+            return statements[0]
+        
         # Generate candidate statements for this group
         self.log_to_detailed("##### Candidate Generation\n\n")
         
@@ -2144,21 +2490,16 @@ The ranking array must contain integers 1 through {num_candidates}, ordered from
         except ValueError:
             num_candidates = min(len(statements), 4)
             
-        for i in range(num_candidates):
-            if self.stop_event.is_set():
-                return None
-                
-            # Copy and shuffle statements to avoid bias
-            shuffled_statements = statements.copy()
-            random.shuffle(shuffled_statements)
-            
-            # Generate a candidate
-            self.log_to_detailed(f"Generating candidate {i+1}/{num_candidates}\n\n")
-            
-            candidate = self.generate_single_candidate(question, shuffled_statements, i+1)
-            if candidate:
-                candidates.append(candidate)
-                self.log_to_detailed(f"**Candidate {i+1}:**\n{candidate}\n\n")
+        self.log_to_detailed(f"Generating {num_candidates} candidates\n\n")
+        
+        # Each candidate uses its own shuffle of the statements to avoid bias
+        candidates = self.generate_candidates_concurrently(question, statements, num_candidates)
+        
+        if self.stop_event.is_set():
+            return None
+        
+        for i, candidate in enumerate(candidates):
+            self.log_to_detailed(f"**Candidate {i+1}:**\n{candidate}\n\n")
         
         if not candidates:
             self.log_to_detailed("**Error:** Failed to generate any candidate statements.\n\n")
@@ -2189,24 +2530,16 @@ The ranking array must contain integers 1 through {num_candidates}, ordered from
         # Initialize rankings
         rankings = {i: [] for i in range(len(voting_participants))}
         
-        # For each participant, predict their rankings
-        for p_idx, (orig_idx, statement) in enumerate(voting_participants):
-            if self.stop_event.is_set():
-                return None
-                
-            self.log_to_detailed(f"**Predicting ranking for Voter {p_idx+1} (Participant {orig_idx+1})**\n\n")
-            
-            # Predict ranking for this participant
-            predicted_ranking, attempts_log = self.predict_participant_ranking_json(
-                question, 
-                statement, 
-                candidates,
-                orig_idx + 1  # Use original participant number for prompt
-            )
-            
+        # Predict every voter's ranking concurrently
+        voters = [
+            (statement, orig_idx + 1, f"Voter {p_idx+1} (Participant {orig_idx+1})")  # Original participant numbers
+            for p_idx, (orig_idx, statement) in enumerate(voting_participants)
+        ]
+        predictions = self.predict_rankings_concurrently(question, voters, candidates)
+        
+        for p_idx, (predicted_ranking, attempts_log) in enumerate(predictions):
             if predicted_ranking:
                 rankings[p_idx] = predicted_ranking
-                self.log_to_detailed(f"**Predicted ranking:** {[r+1 for r in predicted_ranking]}\n\n")
         
         if self.stop_event.is_set():
             return None
@@ -2222,19 +2555,22 @@ The ranking array must contain integers 1 through {num_candidates}, ordered from
         
         return candidates[winner_idx]
     
-    def divide_statements_into_groups(self, statements, max_group_size):
-        """Divide statements into groups of maximum size"""
-        # Shuffle statements first to avoid manipulation
-        shuffled_statements = statements.copy()
-        random.shuffle(shuffled_statements)
+    def partition_indices(self, num_statements, max_group_size):
+        """
+        Split statement indices into shuffled, balanced groups of at most max_group_size.
+
+        Returns a list of index lists, so callers know which statement (and
+        therefore which participants) ended up in each group.
+        """
+        # Shuffle first to avoid manipulation
+        order = list(range(num_statements))
+        random.shuffle(order)
         
         # Calculate number of groups needed
-        num_statements = len(shuffled_statements)
         num_groups = math.ceil(num_statements / max_group_size)
         
         # Try to balance group sizes
-        base_size = num_statements // num_groups
-        remainder = num_statements % num_groups
+        base_size, remainder = divmod(num_statements, num_groups)
         
         groups = []
         start_idx = 0
@@ -2244,56 +2580,187 @@ The ranking array must contain integers 1 through {num_candidates}, ordered from
             group_size = base_size + (1 if i < remainder else 0)
             end_idx = start_idx + group_size
             
-            groups.append(shuffled_statements[start_idx:end_idx])
+            groups.append(order[start_idx:end_idx])
             start_idx = end_idx
             
         return groups
     
+    def divide_statements_into_groups(self, statements, max_group_size):
+        """Divide statements into shuffled groups of maximum size"""
+        return [
+            [statements[i] for i in member_indices]
+            for member_indices in self.partition_indices(len(statements), max_group_size)
+        ]
+    
     def update_friendly_output_with_winner(self, winning_statement):
         """Insert the winning statement at the top of the friendly output"""
-        # Flash to indicate activity
-        self.flash_textbox(self.friendly_output)
-        
-        # Get current content
-        current_content = self.friendly_output.get("1.0", "end-1c")
-        
-        # Create new content with winning statement at the top
-        winner_section = f"## 🏆 Winning Consensus Statement\n\n{winning_statement}\n\n---\n\n"
-        new_content = winner_section + current_content
-        
-        # Update the textbox
-        self.friendly_output.delete("1.0", "end")
-        self.friendly_output.insert("1.0", new_content)
-        
-        # Scroll to the top
-        self.friendly_output.see("1.0")
+        self.prepend_to_friendly(f"## 🏆 Winning Consensus Statement\n\n{winning_statement}\n\n---\n\n")
 
     def update_friendly_output_with_consensus(self, consensus_statement):
         """Insert the final consensus statement at the top of the friendly output"""
+        self.prepend_to_friendly(f"## 🏆 Final Group Consensus\n\n{consensus_statement}\n\n---\n\n")
+
+    def prepend_to_friendly(self, section):
+        """Put a section at the top of the friendly output (safe from worker threads)"""
+        with self.flush_lock:
+            content = self.friendly_log.getvalue()
+            self.friendly_log = io.StringIO(section + content)
+            self.friendly_log.seek(0, io.SEEK_END)
+        self.root.after(0, lambda: self._prepend_to_textbox(self.friendly_output, section))
+
+    def _prepend_to_textbox(self, textbox, text):
+        """Helper to insert text at the top of a textbox and scroll to it"""
         # Flash to indicate activity
-        self.flash_textbox(self.friendly_output)
-        
-        # Get current content
-        current_content = self.friendly_output.get("1.0", "end-1c")
-        
-        # Create new content with consensus statement at the top
-        consensus_section = f"## 🏆 Final Group Consensus\n\n{consensus_statement}\n\n---\n\n"
-        new_content = consensus_section + current_content
+        self.flash_textbox(textbox)
+        textbox.insert("1.0", text, OUTPUT_PINNED_TAG)
+        textbox.see("1.0")
+
+    def open_auto_save(self, friendly_name, detailed_name):
+        """Open the auto-save files in the output directory; log_to_* then appends to them"""
+        files = {}
+        try:
+            # Create output directory if it doesn't exist
+            os.makedirs("output", exist_ok=True)
+            for output_type, filename in (("friendly", friendly_name), ("detailed", detailed_name)):
+                files[output_type] = open(os.path.join("output", filename), 'w', encoding='utf-8',
+                                          buffering=AUTO_SAVE_BUFFER_SIZE)
+        except OSError as e:
+            for file in files.values():
+                file.close()
+            self.log_to_friendly(f"\n\n*Failed to auto-save results: {str(e)}*\n")
+            logger.error(f"Auto-save error: {str(e)}")
+            return
         
-        # Update the textbox
-        self.friendly_output.delete("1.0", "end")
-        self.friendly_output.insert("1.0", new_content)
+        with self.flush_lock:
+            self.auto_save_files = files
+
+    def _write_auto_save(self, output_type, text):
+        """Append text to an auto-save file (caller holds flush_lock)"""
+        file = self.auto_save_files[output_type]
+        try:
+            file.write(text)
+        except OSError as e:
+            # Stop saving this output rather than failing the run
+            del self.auto_save_files[output_type]
+            file.close()
+            logger.error(f"Auto-save error: {str(e)}")
+
+    def close_auto_save(self):
+        """Close any open auto-save files, keeping what was written so far
+
+        Returns:
+            Dict mapping output type to the path of its saved file
+        """
+        with self.flush_lock:
+            files, self.auto_save_files = self.auto_save_files, {}
+            # The friendly file lacks any banner prepended to the output since it
+            # was opened, so rewrite it whole (it is small)
+            if "friendly" in files:
+                try:
+                    files["friendly"].seek(0)
+                    files["friendly"].truncate()
+                    files["friendly"].write(self.friendly_log.getvalue())
+                except OSError as e:
+                    logger.error(f"Auto-save error: {str(e)}")
         
-        # Scroll to the top
-        self.friendly_output.see("1.0")
+        paths = {}
+        for output_type, file in files.items():
+            try:
+                file.close()
+                paths[output_type] = file.name
+            except OSError as e:
+                logger.error(f"Auto-save error: {str(e)}")
+        return paths
+
+    def finish_auto_save(self):
+        """Close the auto-save files at the end of a run and report where they are"""
+        paths = self.close_auto_save()
+        if "friendly" in paths:
+            self.log_to_friendly(f"\n\n*Results automatically saved to {paths['friendly']}*\n")
+        else:
+            self.log_to_friendly("\n\n*Failed to auto-save results, see habermas_machine.log*\n")
+        if "detailed" in paths:
+            self.log_to_detailed(f"\n\n*Detailed record automatically saved to {paths['detailed']}*\n")
+
+    def get_output_text(self, output_type):
+        """Return the complete friendly or detailed output, including trimmed lines"""
+        with self.flush_lock:
+            log = self.friendly_log if output_type == "friendly" else self.detailed_log
+            return log.getvalue()
     
     def log_to_friendly(self, text):
         """Append text to the friendly output"""
-        self.root.after(0, lambda: self._append_to_textbox(self.friendly_output, text))
+        with self.flush_lock:
+            self.friendly_log.write(text)
+            self.friendly_buffer.append(text)
+            if "friendly" in self.auto_save_files:
+                self._write_auto_save("friendly", text)
+        self.schedule_flush()
     
     def log_to_detailed(self, text):
         """Append text to the detailed output"""
-        self.root.after(0, lambda: self._append_to_textbox(self.detailed_output, text))
+        with self.flush_lock:
+            self.detailed_log.write(text)
+            self.detailed_buffer.append(text)
+            if "detailed" in self.auto_save_files:
+                self._write_auto_save("detailed", text)
+        self.schedule_flush()
+
+    def queue_debug_prompt(self, prompt):
+        """Show a prompt in the debug view on the next flush"""
+        self.pending_debug_prompt = prompt
+        self.schedule_flush()
+
+    def queue_debug_response(self, response):
+        """Show a (partial) response in the debug view on the next flush
+
+        Args:
+            response: Response text, or the list of chunks streamed so far
+                (joined only when the view is actually redrawn)
+        """
+        self.pending_debug_response = response
+        self.schedule_flush()
+
+    def schedule_flush(self):
+        """Arrange for flush_output to run once, however many writes arrive meanwhile"""
+        with self.flush_lock:
+            if self.flush_scheduled:
+                return
+            self.flush_scheduled = True
+        self.root.after(LOG_FLUSH_INTERVAL, self.flush_output)
+
+    def flush_output(self):
+        """Write everything queued since the last flush with one insert per textbox"""
+        with self.flush_lock:
+            self.flush_scheduled = False
+            prompt, self.pending_debug_prompt = self.pending_debug_prompt, None
+            response, self.pending_debug_response = self.pending_debug_response, None
+
+        for buffer, textbox in ((self.friendly_buffer, self.friendly_output),
+                                (self.detailed_buffer, self.detailed_output)):
+            chunks = []
+            while buffer:
+                chunks.append(buffer.popleft())
+            if chunks:
+                self._append_to_textbox(textbox, "".join(chunks))
+
+        # Streaming updates only need their latest state shown
+        if prompt is not None:
+            self.update_debug_prompt(prompt)
+        if response is not None:
+            if isinstance(response, list):
+                response = "".join(response)
+            self.update_debug_response(response)
+
+    def clear_outputs(self):
+        """Empty both output textboxes, dropping anything still queued for them"""
+        with self.flush_lock:
+            self.friendly_log = io.StringIO()
+            self.detailed_log = io.StringIO()
+            self.friendly_buffer.clear()
+            self.detailed_buffer.clear()
+        self.friendly_output.delete("1.0", "end")
+        self.detailed_output.delete("1.0", "end")
     
     def _append_to_textbox(self, textbox, text):
         """Helper to append text to a textbox with smooth scrolling"""
@@ -2310,6 +2777,14 @@ The ranking array must contain integers 1 through {num_candidates}, ordered from
         
         # Append the text
         textbox.insert("end", text)
+
+        # Drop the oldest lines once the widget grows past its limit, keeping
+        # any banners prepended at the top
+        line_count = int(textbox.index("end-1c").split(".")[0])
+        if line_count > OUTPUT_MAX_LINES + OUTPUT_TRIM_LINES:
+            pinned = textbox.tag_ranges(OUTPUT_PINNED_TAG)
+            first_line = int(str(textbox.index(pinned[-1])).split(".")[0]) if pinned else 1
+            textbox.delete(f"{first_line}.0", f"{first_line + line_count - OUTPUT_MAX_LINES}.0")
         
         # Maintain scroll position based on previous state
         if at_bottom:
@@ -2345,18 +2820,89 @@ The ranking array must contain integers 1 through {num_candidates}, ordered from
     
     def cleanup_after_process(self):
         """Clean up after the process is complete"""
+        # Keep whatever a stopped or failed run wrote so far
+        self.close_auto_save()
+        self.root.after(0, self.stop_keeping_models_warm)
         self.root.after(0, lambda: self.generate_btn.configure(state="normal"))
         self.root.after(0, lambda: self.recursive_generate_btn.configure(state="normal"))
     
     def stop_generation(self):
         """Stop any ongoing generation process"""
         self.stop_event.set()
-        if self.current_response:
+        with self.responses_lock:
+            responses = list(self.active_responses)
+        for response in responses:
             try:
-                self.current_response.close()
+                response.close()
             except:
                 pass
 
+    def start_keeping_models_warm(self):
+        """Warm the selected models now and keep pinging them until stop_keeping_models_warm"""
+        self.stop_keeping_models_warm()
+        self.keep_models_warm()
+
+    def stop_keeping_models_warm(self):
+        """Cancel the pending warm-up ping, if any"""
+        if self.keep_warm_job is not None:
+            self.root.after_cancel(self.keep_warm_job)
+            self.keep_warm_job = None
+
+    def keep_models_warm(self):
+        """Load the selected models in the background and reschedule the next ping"""
+        targets = {
+            (self.gen_api_endpoint_var.get().strip(), self.gen_model_var.get().strip()),
+            (self.rank_api_endpoint_var.get().strip(), self.rank_model_var.get().strip()),
+        }
+        targets = [(endpoint, model) for endpoint, model in targets if endpoint and model]
+        if targets:
+            Thread(target=self.warm_models, args=(targets,), daemon=True).start()
+        self.keep_warm_job = self.root.after(KEEP_WARM_INTERVAL, self.keep_models_warm)
+
+    def warm_models(self, targets):
+        """Ask Ollama to load each (endpoint, model) pair without generating anything
+
+        Args:
+            targets: List of (api_endpoint, model_name) tuples
+        """
+        for api_endpoint, model in targets:
+            try:
+                # A generate request with no prompt only loads the model
+                response = self.http_session.post(
+                    api_endpoint,
+                    json={"model": model, "keep_alive": OLLAMA_KEEP_ALIVE},
+                    timeout=OLLAMA_TIMEOUT
+                )
+                response.close()
+                logger.debug(f"Warmed model {model} ({response.status_code})")
+            except requests.RequestException as e:
+                logger.debug(f"Could not warm model {model}: {e}")
+
+    def submit_request(self, fn, *args):
+        """Run fn(*args) on the request pool, tracking the future until it finishes"""
+        future = self.request_executor.submit(fn, *args)
+        with self.pending_requests_lock:
+            self.pending_requests.add(future)
+        future.add_done_callback(self._forget_request)
+        return future
+
+    def _forget_request(self, future):
+        """Done-callback that drops a finished future from pending_requests"""
+        with self.pending_requests_lock:
+            self.pending_requests.discard(future)
+
+    def close(self):
+        """Release network resources when the window closes"""
+        self.stop_keeping_models_warm()
+        self.stop_generation()
+        # Cancel queued work by hand; shutdown(cancel_futures=True) needs Python 3.9
+        with self.pending_requests_lock:
+            pending = list(self.pending_requests)
+        for future in pending:
+            future.cancel()
+        self.request_executor.shutdown(wait=False)
+        self.http_session.close()
+
     # Model Management Callbacks (NEW)
     def on_preset_changed(self, preset_name):
         """Handle preset selection change"""
@@ -2377,6 +2923,16 @@ The ranking array must contain integers 1 through {num_candidates}, ordered from
                 "statement_temp": "0.6",
                 "ranking_temp": "0.2"
             },
+            # Ranking only has to emit a short JSON list, so a smaller model
+            # without a <think> phase serves it several times faster
+            "prompted_deepseek_fast_rank": {
+                "model": "deepseek-r1:14b",
+                "rank_model": "qwen2.5:7b",
+                "description": "DeepSeek-R1 14B for statements, Qwen 2.5 7B for ranking - "
+                               "much faster elections, slightly less nuanced ranking predictions",
+                "statement_temp": "0.6",
+                "ranking_temp": "0.2"
+            },
             "prompted_llama": {
                 "model": "llama3.1",
                 "description": "Llama 3.1 - Alternative prompted model with good performance",
@@ -2393,9 +2949,9 @@ The ranking array must contain integers 1 through {num_candidates}, ordered from
 
         if preset_name in preset_configs:
             config = preset_configs[preset_name]
-            # Apply to both generation and ranking models
+            # Apply to both generation and ranking models (ranking may use a lighter model)
             self.gen_model_var.set(config["model"])
-            self.rank_model_var.set(config["model"])
+            self.rank_model_var.set(config.get("rank_model", config["model"]))
             self.gen_temperature_var.set(config["statement_temp"])
             self.rank_temperature_var.set(config["ranking_temp"])
 
@@ -2410,6 +2966,8 @@ The ranking array must contain integers 1 through {num_candidates}, ordered from
                 try:
                     self.log_to_friendly(f"\n🎯 Preset Applied: {preset_name}\n")
                     self.log_to_friendly(f"Model: {config['model']}\n")
+                    if "rank_model" in config:
+                        self.log_to_friendly(f"Ranking Model: {config['rank_model']}\n")
                     self.log_to_friendly(f"Statement Temperature: {config['statement_temp']}\n")
                     self.log_to_friendly(f"Ranking Temperature: {config['ranking_temp']}\n\n")
                 except:
@@ -2455,8 +3013,8 @@ The ranking array must contain integers 1 through {num_candidates}, ordered from
 def main():
     try:
         root = ctk.CTk()
-        root.protocol("WM_DELETE_WINDOW", lambda: (root.quit(), root.destroy()))
         app = HabermasMachine(root)
+        root.protocol("WM_DELETE_WINDOW", lambda: (app.close(), root.quit(), root.destroy()))
         root.mainloop()
     except Exception as e:
         # Create basic error window if initialization fails